@@ -34,7 +34,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Agent configuration"""
     name: str
@@ -48,6 +48,9 @@ class AgentConfig:
     allowed_channels: List[str] = None
     ignore_bots: bool = True
     bot_allowlist: List[str] = None
+    model: Optional[str] = None  # Provider default when unset
+    personality: str = ''
+    system_prompt_additions: str = ''
 
 class MemoryManagerWrapper:
     """Wrapper to make PostgreSQL MemoryClient compatible with existing MemoryManager API"""
@@ -161,7 +164,7 @@ class EnhancedDiscordAgent:
     def _create_llm_provider(self) -> LLMProvider:
         """Create appropriate LLM provider based on config"""
         kwargs = {}
-        if hasattr(self.config, 'model'):
+        if self.config.model:
             kwargs['model'] = self.config.model
         return create_llm_provider(self.config.llm_type, self.config.api_key, **kwargs)
     
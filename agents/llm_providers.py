@@ -9,7 +9,6 @@ import logging
 import asyncio
 from typing import List, Dict, Optional
 from openai import OpenAI
-from xai_sdk import Client as XaiClient
 
 logger = logging.getLogger(__name__)
 
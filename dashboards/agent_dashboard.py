@@ -50,6 +50,10 @@ class SuperAgentDashboard:
         self.agents_status = {}
         self.last_update = datetime.now()
         
+        # Linux pidfds for displayed agents; an agent exiting wakes the refresh loop early
+        self._exit_watches: Dict[int, int] = {}  # pid -> pidfd
+        self._agent_exited = asyncio.Event()
+        
         # Load agent configuration for teams and configs
         self.config_file = Path("agent_config.json")
         self.agent_config_data = self._load_config_data()
@@ -235,9 +239,54 @@ class SuperAgentDashboard:
                     
         except Exception:
             pass
-            
+        
+        self._watch_agent_exits(agent["pid"] for agent in agents.values())
         return agents
     
+    def _watch_agent_exits(self, pids) -> None:
+        """Register a pidfd reader per agent so its exit is seen without polling"""
+        if not hasattr(os, "pidfd_open"):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        
+        for pid in pids:
+            if pid in self._exit_watches:
+                continue
+            try:
+                pidfd = os.pidfd_open(pid)
+            except OSError:
+                continue
+            self._exit_watches[pid] = pidfd
+            loop.add_reader(pidfd, self._on_agent_exit, pid)
+    
+    def _on_agent_exit(self, pid: int) -> None:
+        """pidfd became readable: the agent exited, so refresh now"""
+        pidfd = self._exit_watches.pop(pid)
+        asyncio.get_running_loop().remove_reader(pidfd)
+        os.close(pidfd)
+        self._agent_exited.set()
+    
+    def close_exit_watches(self) -> None:
+        """Remove the pidfd readers and close the pidfds of agents still running"""
+        if not self._exit_watches:
+            return
+        loop = asyncio.get_running_loop()
+        for pidfd in self._exit_watches.values():
+            loop.remove_reader(pidfd)
+            os.close(pidfd)
+        self._exit_watches.clear()
+    
+    async def wait_for_refresh(self, refresh_interval: float) -> None:
+        """Sleep until the next refresh is due or a watched agent exits"""
+        try:
+            await asyncio.wait_for(self._agent_exited.wait(), refresh_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._agent_exited.clear()
+    
     def get_docker_containers(self) -> Dict[str, Dict]:
         """Get SuperAgent Docker containers"""
         containers = {}
@@ -664,11 +713,13 @@ class SuperAgentDashboard:
         with Live(layout, console=self.console, refresh_per_second=1/refresh_interval) as live:
             try:
                 while True:
-                    await asyncio.sleep(refresh_interval)
+                    await self.wait_for_refresh(refresh_interval)
                     self.update_layout(layout)
                     self.last_update = datetime.now()
             except KeyboardInterrupt:
                 self.console.print("\n[yellow]Dashboard stopped by user[/yellow]")
+            finally:
+                self.close_exit_watches()
 
 def main():
     """Main entry point"""
@@ -5,6 +5,7 @@ Real-time monitoring with interactive command support
 """
 
 import asyncio
+import contextlib
 import os
 import json
 import subprocess
@@ -183,7 +184,9 @@ class InteractiveDashboard(SuperAgentDashboard):
         
         last_command_result = ""
         
-        with Live(self.create_layout(), refresh_per_second=1/refresh_interval, console=self.console) as live:
+        with Live(self.create_layout(), refresh_per_second=1/refresh_interval, console=self.console) as live, \
+                contextlib.ExitStack() as cleanup:
+            cleanup.callback(self.close_exit_watches)
             while self.running:
                 try:
                     # Check for new commands
@@ -245,7 +248,7 @@ class InteractiveDashboard(SuperAgentDashboard):
                     layout["sidebar"].update(sidebar)
                     
                     live.update(layout)
-                    await asyncio.sleep(refresh_interval)
+                    await self.wait_for_refresh(refresh_interval)
                     
                 except KeyboardInterrupt:
                     self.running = False
@@ -30,17 +30,11 @@ class MultiAgentLauncher:
         self.config_path = config_path
         self.agents: Dict[str, EnhancedDiscordAgent] = {}
         self.tasks: List[asyncio.Task] = []
+        self._config_data = None
+        self._config_stamp = None  # (st_mtime_ns, st_size) of the parsed config
         
-    def load_config(self) -> dict:
-        """Load agent configuration from JSON file"""
-        with open(self.config_path, 'r') as f:
-            return json.load(f)
-    
-    def create_agent_config(self, agent_name: str, agent_data: dict) -> AgentConfig:
-        """Create AgentConfig from configuration data"""
-        
-        # Get API keys from environment
-        api_keys = {
+        # Get API keys from environment once
+        self._api_keys = {
             'grok4': os.getenv('XAI_API_KEY'),
             'claude': os.getenv('ANTHROPIC_API_KEY'),
             'gemini': os.getenv('GOOGLE_AI_API_KEY'),
@@ -48,16 +42,30 @@ class MultiAgentLauncher:
         }
         
         # Get bot tokens (try agent-specific first, then fall back to shared)
-        bot_tokens = {
-            'grok4': os.getenv('DISCORD_TOKEN_GROK'),
-            'claude': os.getenv('DISCORD_TOKEN_CLAUDE') or os.getenv('DISCORD_TOKEN_GROK'),
-            'gemini': os.getenv('DISCORD_TOKEN_GEMINI') or os.getenv('DISCORD_TOKEN_GROK'),
-            'openai': os.getenv('DISCORD_TOKEN_O3') or os.getenv('DISCORD_TOKEN_GROK')
+        shared_token = os.getenv('DISCORD_TOKEN_GROK')
+        self._bot_tokens = {
+            'grok4': shared_token,
+            'claude': os.getenv('DISCORD_TOKEN_CLAUDE') or shared_token,
+            'gemini': os.getenv('DISCORD_TOKEN_GEMINI') or shared_token,
+            'openai': os.getenv('DISCORD_TOKEN_O3') or shared_token
         }
+        self._server_id = os.getenv('DEFAULT_SERVER_ID', '1395578178973597799')
         
+    def load_config(self) -> dict:
+        """Load agent configuration from JSON file, reparsing only when it changes"""
+        st = os.stat(self.config_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._config_data is None or stamp != self._config_stamp:
+            with open(self.config_path, 'r') as f:
+                self._config_data = json.load(f)
+            self._config_stamp = stamp
+        return self._config_data
+    
+    def create_agent_config(self, agent_name: str, agent_data: dict) -> AgentConfig:
+        """Create AgentConfig from configuration data"""
         llm_type = agent_data['llm_type']
-        api_key = api_keys.get(llm_type)
-        bot_token = bot_tokens.get(llm_type)
+        api_key = self._api_keys.get(llm_type)
+        bot_token = self._bot_tokens.get(llm_type)
         
         if not api_key:
             raise ValueError(f"Missing API key for {llm_type}. Set environment variable.")
@@ -68,7 +76,7 @@ class MultiAgentLauncher:
         config = AgentConfig(
             name=agent_data['name'],
             bot_token=bot_token,
-            server_id=os.getenv('DEFAULT_SERVER_ID', '1395578178973597799'),
+            server_id=self._server_id,
             api_key=api_key,
             llm_type=llm_type,
             max_context_messages=agent_data.get('max_context_messages', 15),
@@ -76,18 +84,17 @@ class MultiAgentLauncher:
             response_delay=agent_data.get('response_delay', 2.0),
             allowed_channels=agent_data.get('allowed_channels', []),
             ignore_bots=agent_data.get('ignore_bots', True),
-            bot_allowlist=agent_data.get('bot_allowlist', [])
+            bot_allowlist=agent_data.get('bot_allowlist', []),
+            model=agent_data.get('model')  # Model override, e.g. for OpenAI
         )
         
-        # Add model parameter for OpenAI
-        if 'model' in agent_data:
-            config.model = agent_data['model']
-        
         return config
     
-    async def launch_agent(self, agent_name: str, config: AgentConfig):
-        """Launch a single agent"""
+    async def launch_agent(self, agent_name: str, config: AgentConfig, delay: float = 0.0):
+        """Launch a single agent, optionally after a staggered delay"""
         try:
+            if delay:
+                await asyncio.sleep(delay)
             logger.info(f"Starting agent: {agent_name}")
             agent = EnhancedDiscordAgent(config)
             self.agents[agent_name] = agent
@@ -110,11 +117,12 @@ class MultiAgentLauncher:
             
             try:
                 agent_config = self.create_agent_config(agent_name, config_data['agents'][agent_name])
-                task = asyncio.create_task(self.launch_agent(agent_name, agent_config))
-                self.tasks.append(task)
                 
-                # Small delay between agent launches
-                await asyncio.sleep(2)
+                # Stagger connections inside each task so launching never blocks here
+                task = asyncio.create_task(
+                    self.launch_agent(agent_name, agent_config, delay=len(self.tasks) * 2.0)
+                )
+                self.tasks.append(task)
                 
             except Exception as e:
                 logger.error(f"Failed to create {agent_name}: {e}")
@@ -4,6 +4,7 @@ MCP DevOps Agent Startup Script
 Launcher for the MCP-based AI DevOps agent with environment validation
 """
 
+import importlib.util
 import os
 import sys
 import asyncio
@@ -13,6 +14,12 @@ from dotenv import load_dotenv
 # Load .env file automatically
 load_dotenv()
 
+# Control plane package lives at the repository root, next to launchers/
+CONTROL_PLANE_DIR = Path(__file__).resolve().parent.parent / 'control_plane'
+
+# Packages the agent needs at runtime
+REQUIRED_MODULES = ('anthropic', 'docker', 'psutil', 'mcp')
+
 def check_environment():
     """Check that required environment variables are set"""
     print("🔍 Checking environment...")
@@ -23,10 +30,7 @@ def check_environment():
         'DEFAULT_SERVER_ID'
     ]
     
-    missing = []
-    for var in required_vars:
-        if not os.getenv(var):
-            missing.append(var)
+    missing = [var for var in required_vars if not os.environ.get(var)]
     
     if missing:
         print(f"❌ Missing required environment variables: {', '.join(missing)}")
@@ -42,19 +46,16 @@ def check_dependencies():
     """Check that required Python packages are installed"""
     print("🔍 Checking dependencies...")
     
-    try:
-        import anthropic
-        import docker
-        import psutil
-        from mcp import ClientSession, StdioServerParameters
-        from mcp.client.stdio import stdio_client
-        print("✅ Core dependencies and MCP available")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
+    # find_spec locates packages without running their (slow) module imports
+    missing = [mod for mod in REQUIRED_MODULES if importlib.util.find_spec(mod) is None]
+    if missing:
+        print(f"❌ Missing dependency: {', '.join(missing)}")
         print("Install with: pip install -r control_plane/requirements.txt")
         print("Also ensure MCP client is installed: pip install mcp")
         return False
+    
+    print("✅ Core dependencies and MCP available")
+    return True
 
 def check_docker():
     """Check Docker daemon status"""
@@ -96,7 +97,7 @@ async def start_agent():
     print("🚀 Starting MCP DevOps Agent...")
     
     # Add control_plane to Python path
-    sys.path.insert(0, str(Path(__file__).parent / 'control_plane'))
+    sys.path.insert(0, str(CONTROL_PLANE_DIR))
     
     try:
         from mcp_devops_agent import MCPDevOpsAgent
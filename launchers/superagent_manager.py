@@ -4,16 +4,15 @@ SuperAgent Manager - Main application for deploying and managing agents
 Integrates single agent launcher with CLI dashboard
 """
 
-import asyncio
 import os
 import subprocess
 import signal
 import sys
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import argparse
 from datetime import datetime
-import psutil
 import json
 
 from dotenv import load_dotenv
@@ -22,115 +21,333 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Line an agent logs once its MCP session is up; deploys finish as soon as it appears
+AGENT_READY_MARKER = "MCP session initialized successfully!"
+
+# How long one process scan answers running-agent lookups (dashboards refresh in bursts)
+PID_CACHE_TTL = 0.5
+
+# Parsed agent_config.json per path, keyed by (st_mtime_ns, st_size)
+_CONFIG_CACHE: Dict[Path, Tuple[int, int, Dict]] = {}
+
+# Agents run as `python launch_single_agent.py <agent_type>` from this directory
+LAUNCHER_DIR = Path(__file__).parent
+LAUNCHER_SCRIPT = "launch_single_agent.py"
+
+# Subprocess agents deployed by earlier CLI invocations, so list/status survive restarts
+STATE_FILE = LAUNCHER_DIR / ".superagent_state.json"
+
+# Grace period for in-process agent tasks to finish after cancellation
+TASK_STOP_TIMEOUT = 10.0
+
+# Grace period after SIGTERM before agent processes are killed; shared by a whole batch
+AGENT_STOP_TIMEOUT = 10.0
+
+# Longest a deploy waits for the ready marker; a process still alive then counts as deployed
+AGENT_READY_TIMEOUT = 5.0
+LOG_POLL_INTERVAL = 0.1
+
+# Bytes of a failed agent's log shown in the deploy error
+LOG_TAIL_BYTES = 8192
+
 class SuperAgentManager:
     """Main SuperAgent management system"""
     
+    # Available agent types and their configurations; main() builds CLI choices from these
+    AGENT_CONFIGS = {
+        "grok4_agent": {
+            "name": "Grok4Agent",
+            "token_env": "DISCORD_TOKEN_GROK",
+            "api_key_env": "XAI_API_KEY",
+            "description": "Expert AI researcher with live web search",
+            "llm_type": "grok4"
+        },
+        "claude_agent": {
+            "name": "ClaudeAgent", 
+            "token_env": "DISCORD_TOKEN2",
+            "api_key_env": "ANTHROPIC_API_KEY",
+            "description": "Thoughtful reasoning and code analysis specialist",
+            "llm_type": "claude"
+        },
+        "gemini_agent": {
+            "name": "GeminiAgent",
+            "token_env": "DISCORD_TOKEN3", 
+            "api_key_env": "GOOGLE_AI_API_KEY",
+            "description": "Creative collaborator and multimodal specialist",
+            "llm_type": "gemini"
+        },
+        "o3_agent": {
+            "name": "O3Agent",
+            "token_env": "DISCORD_TOKEN4",
+            "api_key_env": "OPENAI_API_KEY", 
+            "description": "Logical reasoning and mathematical specialist",
+            "llm_type": "openai"
+        }
+    }
+    
     def __init__(self):
         self.running_agents = {}
+        self._pid_cache: Dict[str, int] = {}  # agent type -> pid, from the last scan
+        self._pid_cache_expires = 0.0  # monotonic time the scan goes stale
+        self._cpu_samples: Dict[Tuple[int, float], Tuple[float, float]] = {}  # (pid, create time) -> (cpu seconds, monotonic time)
         self.logs_dir = Path("logs")
+        
+        # Resolved once: the launcher's virtualenv interpreter if present
+        venv_python = LAUNCHER_DIR / ".venv" / "bin" / "python"
+        self._agent_python = str(venv_python) if venv_python.exists() else "python"
+        self._launcher_cwd = str(LAUNCHER_DIR)
         self.logs_dir.mkdir(exist_ok=True)
         
         # Load agent and team configuration from agent_config.json
-        self.config_file = Path(__file__).parent / "agent_config.json"
+        self.config_file = LAUNCHER_DIR / "agent_config.json"
         self.load_config()
         
         # Available agent types and their configurations
-        self.agent_configs = {
-            "grok4_agent": {
-                "name": "Grok4Agent",
-                "token_env": "DISCORD_TOKEN_GROK",
-                "api_key_env": "XAI_API_KEY",
-                "description": "Expert AI researcher with live web search",
-                "llm_type": "grok4"
-            },
-            "claude_agent": {
-                "name": "ClaudeAgent", 
-                "token_env": "DISCORD_TOKEN2",
-                "api_key_env": "ANTHROPIC_API_KEY",
-                "description": "Thoughtful reasoning and code analysis specialist",
-                "llm_type": "claude"
-            },
-            "gemini_agent": {
-                "name": "GeminiAgent",
-                "token_env": "DISCORD_TOKEN3", 
-                "api_key_env": "GOOGLE_AI_API_KEY",
-                "description": "Creative collaborator and multimodal specialist",
-                "llm_type": "gemini"
-            },
-            "o3_agent": {
-                "name": "O3Agent",
-                "token_env": "DISCORD_TOKEN4",
-                "api_key_env": "OPENAI_API_KEY", 
-                "description": "Logical reasoning and mathematical specialist",
-                "llm_type": "openai"
-            }
-        }
+        self.agent_configs = dict(self.AGENT_CONFIGS)
+        self._known_agents = frozenset(self.agent_configs)
+        
+        # Tokens, API keys and server id, read once per manager
+        self._env = self._snapshot_env()
+        self._validation: Dict[str, Tuple[bool, str]] = {}  # agent type -> validate_agent_config result
+        
+        # Pick up agents deployed by earlier invocations
+        self.load_state()
     
     def load_config(self):
         """Load teams and agent configuration from JSON file"""
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
-                    self.teams_config = config_data.get('teams', {})
-                    self.global_settings = config_data.get('global_settings', {})
-            else:
+            try:
+                st = self.config_file.stat()
+            except FileNotFoundError:
                 self.teams_config = {}
                 self.global_settings = {}
+                return
+            
+            # Reparse only when the file changed since another manager loaded it
+            cached = _CONFIG_CACHE.get(self.config_file)
+            if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+                config_data = cached[2]
+            else:
+                with open(self.config_file, 'r') as f:
+                    config_data = json.load(f)
+                _CONFIG_CACHE[self.config_file] = (st.st_mtime_ns, st.st_size, config_data)
+            self.teams_config = config_data.get('teams', {})
+            self.global_settings = config_data.get('global_settings', {})
         except Exception as e:
             print(f"Warning: Could not load config file: {e}")
             self.teams_config = {}
             self.global_settings = {}
     
+    def _all_required_envs(self) -> List[str]:
+        """Environment variables any configured agent reads"""
+        names = {"DEFAULT_SERVER_ID"}
+        for config in self.agent_configs.values():
+            names.update((config["token_env"], config["api_key_env"]))
+        return sorted(names)
+    
+    def _snapshot_env(self) -> Dict[str, Optional[str]]:
+        """Values of the environment variables any configured agent reads"""
+        return {name: os.getenv(name) for name in self._all_required_envs()}
+    
+    def load_state(self):
+        """Adopt agents recorded by earlier invocations whose processes are still alive"""
+        try:
+            with open(STATE_FILE, 'r') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Warning: Could not load agent state: {e}")
+            return
+        
+        for agent_type, info in state.items():
+            if agent_type in self.agent_configs and self._is_agent_process(info.get("pid"), agent_type):
+                started = datetime.fromisoformat(info["started"])
+                self.running_agents[agent_type] = {
+                    "pid": info["pid"],
+                    "started": started,
+                    "started_mono": time.monotonic() - (time.time() - started.timestamp()),
+                    "log_file": info["log_file"],
+                    "config": self.agent_configs[agent_type],
+                    "adopted": True  # not ours to stop in cleanup()
+                }
+    
+    def save_state(self, removed: Tuple[str, ...] = ()):
+        """Atomically merge the subprocess agents this manager knows about into the state file"""
+        # Other CLI invocations may have recorded agents since we loaded; keep theirs
+        try:
+            with open(STATE_FILE, 'r') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            state = {}
+        except Exception as e:
+            print(f"Warning: Could not load agent state: {e}")
+            state = {}
+        for agent_type in removed:
+            state.pop(agent_type, None)
+        state.update({
+            agent_type: {
+                "pid": info["pid"],
+                "started": info["started"].isoformat(),
+                "log_file": info["log_file"]
+            }
+            for agent_type, info in self.running_agents.items()
+            if "task" not in info  # in-process agents die with this process
+        })
+        tmp_file = STATE_FILE.with_suffix(f".{os.getpid()}.tmp")  # concurrent CLI runs must not share it
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_file, STATE_FILE)
+        except Exception as e:
+            print(f"Warning: Could not save agent state: {e}")
+    
+    @staticmethod
+    def _is_agent_process(pid: Optional[int], agent_type: str) -> bool:
+        """True if pid is alive and still runs launch_single_agent.py for agent_type"""
+        import psutil
+        if not pid or not psutil.pid_exists(pid):
+            return False
+        try:
+            cmdline = psutil.Process(pid).cmdline()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return False
+        return SuperAgentManager._launched_agent_type(cmdline) == agent_type
+    
+    @staticmethod
+    def _launched_agent_type(cmdline: List[str], known: Optional[frozenset] = None) -> Optional[str]:
+        """Agent type a ``python launch_single_agent.py <type>`` argv runs, else None"""
+        # Interpreter flags (-u, -X opt, ...) may precede the script, so look for it anywhere
+        # after argv[0]. A shell merely mentioning the launcher has it inside its one -c
+        # argument, whose basename is never exactly the script name
+        for i, arg in enumerate(cmdline[1:], start=1):
+            if os.path.basename(arg) == LAUNCHER_SCRIPT:
+                rest = cmdline[i + 1:]
+                if known is not None:
+                    return next((a for a in rest if a in known), None)
+                return next((a for a in rest if not a.startswith('-')), None)
+        return None
+    
     def validate_agent_config(self, agent_type: str) -> Tuple[bool, str]:
         """Validate agent configuration and tokens"""
         if agent_type not in self.agent_configs:
             return False, f"Unknown agent type: {agent_type}"
         
-        config = self.agent_configs[agent_type]
+        cached = self._validation.get(agent_type)
+        if cached is not None:
+            return cached
         
+        config = self.agent_configs[agent_type]
+        result = self._validation[agent_type] = self._check_settings(config)
+        return result
+    
+    def _check_settings(self, config: Dict) -> Tuple[bool, str]:
+        """Check an agent's token, API key and server id in the environment snapshot"""
         # Check Discord token
-        token = os.getenv(config["token_env"])
-        if not token:
+        if not self._env.get(config["token_env"]):
             return False, f"Missing Discord token: {config['token_env']}"
         
         # Check API key
-        api_key = os.getenv(config["api_key_env"]) 
-        if not api_key:
+        if not self._env.get(config["api_key_env"]):
             return False, f"Missing API key: {config['api_key_env']}"
         
         # Check server ID
-        server_id = os.getenv("DEFAULT_SERVER_ID")
-        if not server_id:
+        if not self._env.get("DEFAULT_SERVER_ID"):
             return False, "Missing DEFAULT_SERVER_ID"
         
         return True, "Configuration valid"
     
     def _find_running_agent(self, agent_type: str) -> Optional[int]:
         """Find if an agent is already running by scanning processes"""
+        # Known agents are checked directly instead of walking every process
+        info = self.running_agents.get(agent_type)
+        if info and "task" not in info and self._is_agent_process(info["pid"], agent_type):
+            return info["pid"]
+        
+        return self._scan_agent_pids().get(agent_type)
+    
+    def _scan_agent_pids(self) -> Dict[str, int]:
+        """Map agent type -> pid with one process scan, reused for PID_CACHE_TTL or until agents change"""
+        now = time.monotonic()
+        if now >= self._pid_cache_expires:
+            processes = self._proc_agents()
+            if processes is None:
+                processes = self._pgrep_agents()
+            if processes is None:
+                import psutil
+                # process_iter prefetches the requested fields under oneshot()
+                processes = [
+                    (proc.info['pid'], proc.info.get('cmdline') or [])
+                    for proc in psutil.process_iter(['pid', 'cmdline'])
+                ]
+            
+            pids = {}
+            for pid, cmdline in processes:
+                agent_type = self._launched_agent_type(cmdline, self._known_agents)
+                if agent_type:
+                    pids.setdefault(agent_type, pid)
+            self._pid_cache = pids
+            self._pid_cache_expires = now + PID_CACHE_TTL
+        return self._pid_cache
+    
+    @staticmethod
+    def _proc_agents() -> Optional[List[Tuple[int, List[str]]]]:
+        """(pid, argv) of agent launcher processes read straight from /proc; None off Linux"""
         try:
-            import psutil
-            for proc in psutil.process_iter(['pid', 'cmdline']):
+            entries = os.scandir('/proc')
+        except OSError:
+            return None
+        
+        marker = LAUNCHER_SCRIPT.encode()
+        processes = []
+        with entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
                 try:
-                    cmdline = proc.info.get('cmdline', [])
-                    if cmdline and 'launch_single_agent.py' in ' '.join(cmdline) and agent_type in cmdline:
-                        return proc.info['pid']
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    with open(f'/proc/{entry.name}/cmdline', 'rb') as f:
+                        data = f.read()
+                except OSError:  # exited mid-scan or not ours to read
                     continue
+                if marker in data:
+                    argv = data.split(b'\x00')[:-1]
+                    processes.append((int(entry.name), [arg.decode(errors='replace') for arg in argv]))
+        return processes
+    
+    @staticmethod
+    def _pgrep_agents() -> Optional[List[Tuple[int, List[str]]]]:
+        """(pid, argv) of agent launcher processes found by one pgrep call; None if pgrep is unusable"""
+        try:
+            result = subprocess.run(['pgrep', '-f', LAUNCHER_SCRIPT],
+                                    capture_output=True, text=True, timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
             return None
-        except ImportError:
-            # Fallback to subprocess if psutil not available
-            try:
-                result = subprocess.run(['pgrep', '-f', f'launch_single_agent.py {agent_type}'], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0 and result.stdout.strip():
-                    return int(result.stdout.strip().split('\n')[0])
-            except:
-                pass
+        if result.returncode > 1:  # 1 just means no matches
             return None
+        
+        # pgrep prints argv space-joined; fetch the real argv so arguments with spaces survive
+        import psutil
+        processes = []
+        for pid in result.stdout.split():
+            try:
+                processes.append((int(pid), psutil.Process(int(pid)).cmdline()))
+            except (ValueError, psutil.Error):
+                continue
+        return processes
     
     def deploy_agent(self, agent_type: str) -> Tuple[bool, str]:
         """Deploy a single agent"""
+        import asyncio
+        return asyncio.run(self._deploy_one(agent_type))
+    
+    async def deploy_all(self, agent_types: List[str]) -> List[Tuple[bool, str]]:
+        """Deploy several agents at once, overlapping their startup checks"""
+        import asyncio
+        return await asyncio.gather(*(self._deploy_one(agent_type) for agent_type in agent_types))
+    
+    async def _deploy_one(self, agent_type: str) -> Tuple[bool, str]:
+        """Launch an agent process and confirm it survives startup"""
+        import psutil
         # Validate configuration
         is_valid, msg = self.validate_agent_config(agent_type)
         if not is_valid:
@@ -142,26 +359,24 @@ class SuperAgentManager:
             return False, f"Agent {agent_type} is already running (PID: {existing_pid})"
         
         try:
-            # Get virtual environment python
-            venv_python = Path(__file__).parent / ".venv" / "bin" / "python"
-            if not venv_python.exists():
-                venv_python = "python"
-            
             # Create log file
             log_file = self.logs_dir / f"{agent_type}.log"
             
-            # Start agent process
+            # Start agent process (Popen, not an asyncio subprocess: the agent must
+            # outlive the event loop used for the startup check)
             with open(log_file, 'w') as log_handle:
                 process = subprocess.Popen(
-                    [str(venv_python), "launch_single_agent.py", agent_type],
+                    [self._agent_python, LAUNCHER_SCRIPT, agent_type],
                     stdout=log_handle,
                     stderr=subprocess.STDOUT,
-                    cwd=str(Path(__file__).parent)
+                    stdin=subprocess.DEVNULL,
+                    cwd=self._launcher_cwd,
+                    # Own session: the agent outlives this CLI's terminal. CPython
+                    # launches via vfork/posix_spawn here, so no page tables are copied.
+                    start_new_session=True
                 )
             
-            # Give it a moment to start
-            import time
-            time.sleep(2)
+            ready = await self._wait_until_ready(process, log_file)
             
             # Check if process is still running
             if process.poll() is None:
@@ -169,64 +384,203 @@ class SuperAgentManager:
                 self.running_agents[agent_type] = {
                     "pid": process.pid,
                     "process": process,
+                    "psutil": psutil.Process(process.pid),
                     "started": datetime.now(),
+                    "started_mono": time.monotonic(),
                     "log_file": str(log_file),
                     "config": self.agent_configs[agent_type]
                 }
+                self.save_state()
+                self._pid_cache_expires = 0.0
                 
+                if not ready:
+                    return True, f"Deployed {agent_type} (PID: {process.pid}), still starting up"
                 return True, f"Successfully deployed {agent_type} (PID: {process.pid})"
             else:
-                # Process failed to start
-                try:
-                    with open(log_file, 'r') as f:
-                        error_output = f.read()
-                except:
-                    error_output = "Could not read log file"
-                
+                # Process failed to start; include the end of its log
+                tail = self._log_tail(log_file).strip()
+                if tail:
+                    return False, f"Agent failed to start. Last output from {log_file}:\n{tail}"
                 return False, f"Agent failed to start. Check {log_file} for details"
                 
         except Exception as e:
             return False, f"Failed to deploy agent: {e}"
     
-    def stop_agent(self, agent_type: str) -> Tuple[bool, str]:
-        """Stop a running agent"""
-        # Find the running process
-        running_pid = self._find_running_agent(agent_type)
-        if not running_pid:
-            return False, f"Agent {agent_type} is not running"
+    @staticmethod
+    def _log_tail(log_file: Path, limit: int = LOG_TAIL_BYTES) -> str:
+        """Last ``limit`` bytes of a log, however large it grew"""
+        try:
+            with open(log_file, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - limit))
+                return f.read().decode(errors='replace')
+        except OSError:
+            return ""
+    
+    async def _wait_until_ready(self, process: subprocess.Popen, log_file: Path) -> bool:
+        """Tail the agent log until the ready marker shows up, the process exits, or we time out"""
+        import asyncio
+        # The agent keeps writing to its log file rather than a pipe so it can
+        # outlive this CLI; poll the file instead of sleeping a fixed interval.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + AGENT_READY_TIMEOUT
+        
+        # On Linux a pidfd turns readable the moment the child exits, so a crash
+        # ends the wait immediately rather than at the next poll
+        exited = asyncio.Event()
+        pidfd = None
+        if hasattr(os, "pidfd_open"):
+            try:
+                pidfd = os.pidfd_open(process.pid)
+                loop.add_reader(pidfd, exited.set)
+            except OSError:
+                pidfd = None
         
+        tail = ""
         try:
-            import psutil
-            process = psutil.Process(running_pid)
-            
-            # Terminate the process gracefully
-            process.terminate()
-            
-            # Wait for it to stop
+            with open(log_file, 'r', errors='replace') as log_handle:
+                while True:
+                    chunk = log_handle.read()
+                    if chunk:
+                        tail = tail[-len(AGENT_READY_MARKER):] + chunk
+                        if AGENT_READY_MARKER in tail:
+                            return True
+                    if process.poll() is not None:
+                        return False
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        return False
+                    try:
+                        await asyncio.wait_for(exited.wait(), min(LOG_POLL_INTERVAL, remaining))
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            if pidfd is not None:
+                loop.remove_reader(pidfd)
+                os.close(pidfd)
+    
+    async def run_in_process(self, agent_types: List[str]) -> None:
+        """Host agents as tasks on this process's event loop until interrupted"""
+        import asyncio
+        # Imported here so the subprocess-based commands don't pay for the agent SDKs
+        from launch_single_agent import create_agent_config  # also puts the repo root on sys.path
+        from agents.enhanced_discord_agent import EnhancedDiscordAgent
+        
+        for agent_type in agent_types:
+            is_valid, msg = self.validate_agent_config(agent_type)
+            if not is_valid:
+                print(f"❌ {agent_type}: {msg}")
+                continue
+            agent = EnhancedDiscordAgent(create_agent_config(agent_type))
+            self.running_agents[agent_type] = {
+                "pid": os.getpid(),
+                "task": asyncio.create_task(agent.run(), name=agent_type),
+                "started": datetime.now(),
+                "started_mono": time.monotonic(),
+                "log_file": "stdout",
+                "config": self.agent_configs[agent_type]
+            }
+            print(f"✅ Started {agent_type} in-process")
+        
+        tasks = [info["task"] for info in self.running_agents.values() if "task" in info]
+        if not tasks:
+            return
+        
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, lambda: [task.cancel() for task in tasks])
+        try:
+            for task in asyncio.as_completed(tasks):
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                except Exception as e:
+                    print(f"❌ Agent task failed: {e}")
+        finally:
+            for agent_type in [t for t, info in self.running_agents.items() if "task" in info]:
+                await self.stop_in_process(agent_type)
+    
+    async def stop_in_process(self, agent_type: str) -> Tuple[bool, str]:
+        """Cancel an in-process agent task and wait for it to unwind"""
+        import asyncio
+        info = self.running_agents.pop(agent_type, None)
+        if not info or "task" not in info:
+            return False, f"Agent {agent_type} is not running in-process"
+        
+        task = info["task"]
+        task.cancel()
+        try:
+            await asyncio.wait_for(task, TASK_STOP_TIMEOUT)
+        except asyncio.CancelledError:
+            pass
+        except asyncio.TimeoutError:
+            return False, f"Agent {agent_type} did not stop within {TASK_STOP_TIMEOUT:.0f}s"
+        except Exception:
+            pass
+        return True, f"Successfully stopped {agent_type}"
+    
+    def stop_many(self, agent_types: List[str]) -> List[Tuple[bool, str]]:
+        """Stop several agents: signal them all, then wait out one shared grace period"""
+        import psutil
+        if not agent_types:
+            return []
+        self._scan_agent_pids()  # one scan up front instead of one per agent
+        
+        results: Dict[str, Tuple[bool, str]] = {}
+        stopping: Dict[int, str] = {}  # pid -> agent type
+        procs = []
+        for agent_type in agent_types:
+            running_pid = self._find_running_agent(agent_type)
+            if not running_pid:
+                results[agent_type] = (False, f"Agent {agent_type} is not running")
+                continue
             try:
-                process.wait(timeout=10)
-            except subprocess.TimeoutExpired:
-                # Force kill if it doesn't stop
-                process.kill()
-                process.wait()
-            
-            # Remove from running agents
-            del self.running_agents[agent_type]
-            
-            return True, f"Successfully stopped {agent_type}"
-            
-        except Exception as e:
-            return False, f"Failed to stop agent: {e}"
+                # Terminate the process gracefully
+                proc = psutil.Process(running_pid)
+                proc.terminate()
+            except psutil.Error as e:
+                results[agent_type] = (False, f"Failed to stop agent: {e}")
+                continue
+            stopping[proc.pid] = agent_type
+            procs.append(proc)
+        
+        # All agents shut down concurrently; wait_procs reaps our own children as they exit
+        _, alive = psutil.wait_procs(procs, timeout=AGENT_STOP_TIMEOUT)
+        for proc in alive:
+            # Force kill stragglers
+            try:
+                proc.kill()
+            except psutil.NoSuchProcess:
+                pass
+        psutil.wait_procs(alive)
+        
+        # Remove from running agents
+        for agent_type in stopping.values():
+            self.running_agents.pop(agent_type, None)
+            self._pid_cache.pop(agent_type, None)
+            results[agent_type] = (True, f"Successfully stopped {agent_type}")
+        for key in [key for key in self._cpu_samples if key[0] in stopping]:
+            del self._cpu_samples[key]
+        if stopping:
+            self.save_state(removed=tuple(stopping.values()))
+        
+        return [results[agent_type] for agent_type in agent_types]
+    
+    def stop_agent(self, agent_type: str) -> Tuple[bool, str]:
+        """Stop a running agent"""
+        return self.stop_many([agent_type])[0]
     
     def list_agents(self) -> Dict:
         """List all available and running agents"""
+        now = time.monotonic()
         return {
             "available": self.agent_configs,
             "running": {
                 name: {
                     "pid": info["pid"],
                     "started": info["started"].isoformat(),
-                    "uptime": (datetime.now() - info["started"]).total_seconds(),
+                    "uptime": now - info["started_mono"],
                     "log_file": info["log_file"],
                     "config": info["config"]
                 }
@@ -234,25 +588,71 @@ class SuperAgentManager:
             }
         }
     
+    def _cpu_percent(self, proc: "psutil.Process") -> float:
+        """CPU use since the previous sample of this pid, from cpu_times deltas (call under oneshot())"""
+        times = proc.cpu_times()
+        busy = times.user + times.system
+        now = time.monotonic()
+        create_time = proc.create_time()
+        key = (proc.pid, create_time)  # a reused pid starts a fresh sample
+        previous = self._cpu_samples.get(key)
+        self._cpu_samples[key] = (busy, now)
+        if previous is None:
+            # First sight of this process: average over its lifetime rather than report 0.0
+            lifetime = time.time() - create_time
+            return busy / lifetime * 100 if lifetime > 0 else 0.0
+        if now <= previous[1]:
+            return 0.0
+        return max(0.0, (busy - previous[0]) / (now - previous[1]) * 100)
+    
+    def _prune_cpu_samples(self):
+        """Drop CPU samples of processes that have exited or whose pid was reused"""
+        import psutil
+        for key in list(self._cpu_samples):
+            pid, create_time = key
+            try:
+                alive = psutil.Process(pid).create_time() == create_time
+            except psutil.Error:
+                alive = False
+            if not alive:
+                del self._cpu_samples[key]
+    
     def get_agent_status(self, agent_type: str) -> Dict:
         """Get detailed status of a specific agent"""
+        import psutil
         # Check if agent is actually running by scanning processes
         running_pid = self._find_running_agent(agent_type)
         if not running_pid:
+            self._prune_cpu_samples()
             return {"status": "stopped"}
         
         # Get process info
         try:
-            import psutil
-            proc = psutil.Process(running_pid)
-            create_time = datetime.fromtimestamp(proc.create_time())
+            # Reuse the handle from deploy so CPU use is measured since the last poll
+            info = self.running_agents.get(agent_type)
+            proc = info.get("psutil") if info else None
+            if proc is None or proc.pid != running_pid:
+                if proc is not None:
+                    self._prune_cpu_samples()  # the agent was restarted under a new pid
+                proc = psutil.Process(running_pid)
+                if info is not None:
+                    info["psutil"] = proc
+            
+            # One read of /proc/<pid> for all of the fields below
+            with proc.oneshot():
+                create_time = proc.create_time()
+                memory_info = proc.memory_info()
+                memory_percent = proc.memory_percent()
+                cpu_percent = self._cpu_percent(proc)
             return {
                 "status": "running",
                 "pid": running_pid,
-                "started": create_time.isoformat(),
-                "uptime": (datetime.now() - create_time).total_seconds(),
-                "memory_mb": round(proc.memory_info().rss / 1024 / 1024, 1),
-                "cpu_percent": proc.cpu_percent()
+                "started": datetime.fromtimestamp(create_time).isoformat(),
+                "uptime": time.time() - create_time,
+                "memory_mb": round(memory_info.rss / 1024 / 1024, 1),
+                "memory_percent": memory_percent,
+                "cpu_percent": cpu_percent,
+                "log_file": str(self.logs_dir / f"{agent_type}.log")
             }
         except:
             return {
@@ -271,7 +671,6 @@ class SuperAgentManager:
                 return False, f"Failed to stop agent: {stop_msg}"
         
         # Wait a moment
-        import time
         time.sleep(1)
         
         # Start again
@@ -280,6 +679,7 @@ class SuperAgentManager:
     def list_teams(self) -> Dict:
         """List all available teams and their status"""
         teams_status = {}
+        running_pids = self._scan_agent_pids()
         
         for team_id, team_config in self.teams_config.items():
             # Check which agents in the team are running
@@ -287,7 +687,7 @@ class SuperAgentManager:
             stopped_agents = []
             
             for agent_type in team_config.get('agents', []):
-                if self._find_running_agent(agent_type):
+                if agent_type in running_pids:
                     running_agents.append(agent_type)
                 else:
                     stopped_agents.append(agent_type)
@@ -309,6 +709,7 @@ class SuperAgentManager:
     
     def deploy_team(self, team_id: str) -> Tuple[bool, str]:
         """Deploy all agents in a team"""
+        import asyncio
         if team_id not in self.teams_config:
             return False, f"Unknown team: {team_id}"
         
@@ -321,8 +722,7 @@ class SuperAgentManager:
         results = []
         success_count = 0
         
-        for agent_type in agents:
-            success, msg = self.deploy_agent(agent_type)
+        for agent_type, (success, msg) in zip(agents, asyncio.run(self.deploy_all(agents))):
             results.append(f"   • {agent_type}: {msg}")
             if success:
                 success_count += 1
@@ -349,8 +749,7 @@ class SuperAgentManager:
         results = []
         success_count = 0
         
-        for agent_type in agents:
-            success, msg = self.stop_agent(agent_type)
+        for agent_type, (success, msg) in zip(agents, self.stop_many(agents)):
             results.append(f"   • {agent_type}: {msg}")
             if success:
                 success_count += 1
@@ -383,9 +782,9 @@ class SuperAgentManager:
     def _format_agent_config(self, agent_id: str, config: Dict, verbose: bool = False) -> str:
         """Format a single agent config"""
         # Get environment values
-        token = os.getenv(config["token_env"], "❌ NOT SET")
-        api_key = os.getenv(config["api_key_env"], "❌ NOT SET")
-        server_id = os.getenv("DEFAULT_SERVER_ID", "❌ NOT SET")
+        token = self._env.get(config["token_env"]) or "❌ NOT SET"
+        api_key = self._env.get(config["api_key_env"]) or "❌ NOT SET"
+        server_id = self._env.get("DEFAULT_SERVER_ID") or "❌ NOT SET"
         
         # Truncate tokens for security/readability
         token_display = f"✅ {token[:8]}..." if token != "❌ NOT SET" else token
@@ -426,10 +825,13 @@ class SuperAgentManager:
         return "\n".join(output)
     
     def cleanup(self):
-        """Clean up all running agents"""
+        """Stop the agents this process started; agents adopted from earlier runs keep running"""
+        agent_types = [agent_type for agent_type, info in self.running_agents.items()
+                       if not info.get("adopted")]
+        if not agent_types:
+            return
         print("🛑 Stopping all agents...")
-        for agent_type in list(self.running_agents.keys()):
-            success, msg = self.stop_agent(agent_type)
+        for agent_type, (success, msg) in zip(agent_types, self.stop_many(agent_types)):
             if success:
                 print(f"   ✅ Stopped {agent_type}")
             else:
@@ -440,25 +842,25 @@ def main():
     parser = argparse.ArgumentParser(description='SuperAgent Manager')
     subparsers = parser.add_subparsers(dest='command', help='Commands')
     
+    agent_choices = tuple(SuperAgentManager.AGENT_CONFIGS)
+    
     # Deploy command
     deploy_parser = subparsers.add_parser('deploy', help='Deploy an agent')
-    deploy_parser.add_argument('agent_type', choices=['grok4_agent', 'claude_agent', 'gemini_agent', 'o3_agent'])
+    deploy_parser.add_argument('agent_type', nargs='?', choices=agent_choices)
+    deploy_parser.add_argument('--all', action='store_true', help='Deploy every agent in parallel')
+    deploy_parser.add_argument('--in-process', action='store_true',
+                               help='Run agents as tasks in this process (shares imports and clients; blocks until Ctrl+C)')
     
-    # Stop command
-    stop_parser = subparsers.add_parser('stop', help='Stop an agent')
-    stop_parser.add_argument('agent_type', choices=['grok4_agent', 'claude_agent', 'gemini_agent', 'o3_agent'])
-    
-    # Restart command
-    restart_parser = subparsers.add_parser('restart', help='Restart an agent')
-    restart_parser.add_argument('agent_type', choices=['grok4_agent', 'claude_agent', 'gemini_agent', 'o3_agent'])
+    # Single-agent commands
+    for command, help_text in [('stop', 'Stop an agent'),
+                               ('restart', 'Restart an agent'),
+                               ('status', 'Get agent status'),
+                               ('validate', 'Validate agent configuration')]:
+        subparsers.add_parser(command, help=help_text).add_argument('agent_type', choices=agent_choices)
     
     # List command
     subparsers.add_parser('list', help='List all agents')
     
-    # Status command
-    status_parser = subparsers.add_parser('status', help='Get agent status')
-    status_parser.add_argument('agent_type', choices=['grok4_agent', 'claude_agent', 'gemini_agent', 'o3_agent'])
-    
     # Dashboard command
     dashboard_parser = subparsers.add_parser('dashboard', help='Launch CLI dashboard')
     dashboard_parser.add_argument('--refresh', type=float, default=2.0, help='Refresh interval')
@@ -467,10 +869,6 @@ def main():
     interactive_parser = subparsers.add_parser('interactive', help='Launch interactive dashboard with real-time commands')
     interactive_parser.add_argument('--refresh', type=float, default=2.0, help='Refresh interval')
     
-    # Validate command
-    validate_parser = subparsers.add_parser('validate', help='Validate agent configuration')
-    validate_parser.add_argument('agent_type', choices=['grok4_agent', 'claude_agent', 'gemini_agent', 'o3_agent'])
-    
     # Team commands
     teams_parser = subparsers.add_parser('teams', help='Team management commands')
     team_subparsers = teams_parser.add_subparsers(dest='team_command', help='Team commands')
@@ -512,7 +910,25 @@ def main():
     signal.signal(signal.SIGTERM, signal_handler)
     
     try:
-        if args.command == 'deploy':
+        if args.command == 'deploy' and args.in_process:
+            if not args.all and not args.agent_type:
+                deploy_parser.error("agent_type is required unless --all is given")
+            import asyncio
+            agent_types = list(manager.agent_configs) if args.all else [args.agent_type]
+            asyncio.run(manager.run_in_process(agent_types))
+        
+        elif args.command == 'deploy' and args.all:
+            import asyncio
+            agent_types = list(manager.agent_configs)
+            results = asyncio.run(manager.deploy_all(agent_types))
+            for agent_type, (success, msg) in zip(agent_types, results):
+                print(f"{'✅' if success else '❌'} {msg}")
+            if not all(success for success, _ in results):
+                sys.exit(1)
+        
+        elif args.command == 'deploy':
+            if not args.agent_type:
+                deploy_parser.error("agent_type is required unless --all is given")
             success, msg = manager.deploy_agent(args.agent_type)
             if success:
                 print(f"✅ {msg}")
@@ -583,12 +999,14 @@ def main():
         elif args.command == 'dashboard':
             print("🚀 Starting SuperAgent Dashboard...")
             print("   Press Ctrl+C to exit")
+            import asyncio
             dashboard = SuperAgentDashboard()
             asyncio.run(dashboard.run(args.refresh))
             
         elif args.command == 'interactive':
             print("🚀 Starting Interactive SuperAgent Dashboard...")
             print("   Type commands while dashboard runs, Press Ctrl+C to exit")
+            import asyncio
             from interactive_dashboard import InteractiveDashboard
             dashboard = InteractiveDashboard()
             asyncio.run(dashboard.run_interactive(args.refresh))
@@ -0,0 +1,13 @@
+"""
+Log locations shared by the chatbot and team MCP servers
+"""
+
+from pathlib import Path
+
+# Launched chatbots write their combined output under logs/<agent>/<agent>.log
+CHATBOT_LOGS_DIR = Path(__file__).parent.parent / "logs"
+
+
+def chatbot_log_file(agent_name: str) -> Path:
+    """Path of the log file a launched chatbot's output is redirected to"""
+    return CHATBOT_LOGS_DIR / agent_name / f"{agent_name}.log"
@@ -19,6 +19,11 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+try:
+    from .chatbot_logs import chatbot_log_file
+except ImportError:
+    from chatbot_logs import chatbot_log_file
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -302,9 +307,8 @@ class ChatbotServer:
                 logger.warning(f"Discord token {discord_token_env} not found in environment")
                 
             # Create logs directory
-            logs_dir = Path(__file__).parent.parent / "logs" / agent_name
-            logs_dir.mkdir(parents=True, exist_ok=True)
-            log_file = logs_dir / f"{agent_name}.log"
+            log_file = chatbot_log_file(agent_name)
+            log_file.parent.mkdir(parents=True, exist_ok=True)
             
             # Launch process
             if background:
@@ -438,8 +442,7 @@ class ChatbotServer:
             agent_config = self.config.get("agents", {}).get(agent_name, {})
             
             # Get log file info
-            logs_dir = Path(__file__).parent.parent / "logs" / agent_name
-            log_file = logs_dir / f"{agent_name}.log"
+            log_file = chatbot_log_file(agent_name)
             log_info = None
             
             if log_file.exists():
@@ -465,8 +468,7 @@ class ChatbotServer:
     async def _get_chatbot_logs(self, agent_name: str, lines: int) -> Dict[str, Any]:
         """Get recent logs from a chatbot"""
         try:
-            logs_dir = Path(__file__).parent.parent / "logs" / agent_name
-            log_file = logs_dir / f"{agent_name}.log"
+            log_file = chatbot_log_file(agent_name)
             
             if not log_file.exists():
                 return {
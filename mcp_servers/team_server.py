@@ -5,23 +5,177 @@ Provides comprehensive team orchestration and management functionality
 """
 
 import asyncio
+import copy
 import json
 import logging
 import os
+from collections import deque
+from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Literal, Optional, Any
 from datetime import datetime
 
+import anyio
+from pydantic import BaseModel, ValidationError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    from .chatbot_logs import chatbot_log_file
+except ImportError:
+    from chatbot_logs import chatbot_log_file
+
 logger = logging.getLogger(__name__)
 
+# Block size used when tailing agent log files from the end
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+# Messages the chatbot relay may hold before reading from the server pauses
+_RELAY_BUFFER_SIZE = 32
+
+# Delay before coalesced team config mutations are written to disk
+_CONFIG_FLUSH_DELAY = 0.25
+
+# Snapshot marker for a team that did not exist before the pending write
+_NO_TEAM = object()
+
+# Status record for agents the chatbot server did not report
+_UNKNOWN_STATUS = {"status": "unknown"}
+
+# Pretty-print the saved team config only when explicitly requested
+_PRETTY_CONFIG = os.environ.get("SUPERAGENT_PRETTY_CONFIG") == "1"
+
+
+def _dump_config(config: Dict[str, Any]) -> bytes:
+    """Serialize configuration for disk, compact unless pretty output is enabled"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 if _PRETTY_CONFIG else 0)
+    if _PRETTY_CONFIG:
+        return json.dumps(config, indent=2).encode()
+    return json.dumps(config, separators=(",", ":")).encode()
+
+
+def _dump_result(result: Dict[str, Any]) -> str:
+    """Serialize a tool result, including any member record dataclasses"""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(result, indent=2, default=asdict)
+
+
+@dataclass(slots=True)
+class TeamMember:
+    """Team member entry returned by list_teams"""
+    name: str
+    status: str
+    pid: Optional[int] = None
+    memory_mb: Optional[float] = None
+    uptime: Optional[float] = None
+    
+    @classmethod
+    def from_status(cls, name: str, agent_info: Dict[str, Any]) -> "TeamMember":
+        """Build a member entry from a chatbot server status record"""
+        return cls(
+            name=name,
+            status=agent_info["status"],
+            pid=agent_info.get("pid"),
+            memory_mb=agent_info.get("memory_mb"),
+            uptime=agent_info.get("uptime")
+        )
+
+
+@dataclass(slots=True)
+class TeamMemberStatus:
+    """Detailed team member entry returned by get_team_status"""
+    name: str
+    display_name: str
+    status: str
+    llm_type: str
+    pid: Optional[int] = None
+    uptime: Optional[float] = None
+    memory_mb: float = 0
+    cpu_percent: float = 0
+    error: Optional[str] = None
+
+
+class ListTeamsArgs(BaseModel):
+    include_inactive: bool = True
+
+
+class StartTeamArgs(BaseModel):
+    team_name: str
+    mode: Literal["parallel", "sequential"] = "parallel"
+
+
+class StopTeamArgs(BaseModel):
+    team_name: str
+    force: bool = False
+
+
+class TeamNameArgs(BaseModel):
+    team_name: str
+
+
+class AddTeamMemberArgs(BaseModel):
+    team_name: str
+    agent_name: str
+
+
+class RemoveTeamMemberArgs(BaseModel):
+    team_name: str
+    agent_name: str
+    stop_agent: bool = False
+
+
+class CreateTeamArgs(BaseModel):
+    team_name: str
+    display_name: str
+    description: str = ""
+    agents: List[str]
+    coordination_mode: Literal["parallel", "sequential", "collaborative"] = "parallel"
+    auto_deploy: bool = False
+
+
+class DeleteTeamArgs(BaseModel):
+    team_name: str
+    force: bool = False
+
+
+class GetTeamLogsArgs(BaseModel):
+    team_name: str
+    lines: int = 20
+    merge: bool = False
+
+
+def _tail_file(path: Path, lines: int) -> List[str]:
+    """Return the last lines of a text file, reading blocks backwards from the end"""
+    if lines <= 0:
+        return []
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        position = os.lseek(fd, 0, os.SEEK_END)
+        chunks = []
+        newlines = 0
+        # One extra newline guarantees the oldest returned line is complete
+        while position > 0 and newlines <= lines:
+            size = min(_TAIL_BLOCK_SIZE, position)
+            position -= size
+            chunk = os.pread(fd, size, position)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    finally:
+        os.close(fd)
+    text = b"".join(reversed(chunks)).decode(errors="replace")
+    return list(deque(text.splitlines(keepends=True), maxlen=lines))
+
 
 class TeamServer:
     """MCP Server for team management and orchestration"""
@@ -30,6 +184,14 @@ class TeamServer:
         self.server = Server("team-manager")
         self.config = self._load_team_config()
         self.chatbot_server_script = Path(__file__).parent / "chatbot_server.py"
+        self._dirty_teams: set = set()
+        self._team_snapshots: Dict[str, Any] = {}  # team -> config as last written, for rollback
+        self._config_fragments: Dict[Any, bytes] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._chatbot_session: Optional[ClientSession] = None
+        self._chatbot_session_lock = asyncio.Lock()
+        self._chatbot_task: Optional[asyncio.Task] = None
+        self._chatbot_closed: Optional[asyncio.Event] = None
         self._setup_tools()
         
     def _load_team_config(self) -> Dict[str, Any]:
@@ -59,20 +221,107 @@ class TeamServer:
             "global_settings": {}
         }
         
-    def _save_team_config(self, config: Dict[str, Any]) -> bool:
-        """Save updated configuration back to file"""
+    def _write_config_file(self, data: bytes) -> bool:
+        """Atomically replace the on-disk configuration with data"""
         try:
             config_path = Path(__file__).parent.parent / "agent_config.json"
-            with open(config_path, 'w') as f:
-                json.dump(config, f, indent=2)
-            self.config = config  # Update in-memory config
+            tmp_path = config_path.with_name(config_path.name + ".tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, config_path)
             logger.info("Team configuration saved successfully")
             return True
         except Exception as e:
             logger.error(f"Failed to save team config: {e}")
             return False
             
-    async def _get_chatbot_client(self):
+    def _save_team_config(self, config: Dict[str, Any]) -> bool:
+        """Save updated configuration back to file, re-serializing all of it"""
+        self._config_fragments.clear()
+        if not self._write_config_file(_dump_config(config)):
+            return False
+        self.config = config  # Update in-memory config
+        return True
+        
+    def _save_team_config_partial(self, team_names: set) -> bool:
+        """Save configuration re-serializing only the given teams
+        
+        Unchanged sections and teams are spliced in from cached compact
+        fragments, so serialization cost scales with the mutated teams.
+        """
+        if _PRETTY_CONFIG:
+            return self._save_team_config(self.config)
+            
+        fragments = self._config_fragments
+        for team_name in team_names:
+            fragments.pop(("teams", team_name), None)
+            
+        parts = []
+        for key, value in self.config.items():
+            if key == "teams":
+                team_parts = []
+                for team_name, team_config in value.items():
+                    fragment = fragments.get(("teams", team_name))
+                    if fragment is None:
+                        fragment = fragments[("teams", team_name)] = _dump_config(team_config)
+                    team_parts.append(_dump_config(team_name) + b":" + fragment)
+                fragment = b"{" + b",".join(team_parts) + b"}"
+            else:
+                fragment = fragments.get(key)
+                if fragment is None:
+                    fragment = fragments[key] = _dump_config(value)
+            parts.append(_dump_config(key) + b":" + fragment)
+            
+        return self._write_config_file(b"{" + b",".join(parts) + b"}")
+        
+    def _snapshot_team(self, team_name: str):
+        """Remember a team's saved config before the first mutation of a pending write"""
+        if team_name not in self._team_snapshots:
+            team_config = self.config.get("teams", {}).get(team_name)
+            self._team_snapshots[team_name] = _NO_TEAM if team_config is None else copy.deepcopy(team_config)
+            
+    async def _persist(self, team_name: str) -> bool:
+        """Mark a team changed and wait for the coalesced write that includes it"""
+        self._dirty_teams.add(team_name)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._debounced_flush(_CONFIG_FLUSH_DELAY))
+        # Mutations arriving within the delay share this write and its result
+        return await asyncio.shield(self._flush_task)
+            
+    async def _debounced_flush(self, delay: float) -> bool:
+        """Wait for further mutations to accumulate, then write once"""
+        await asyncio.sleep(delay)
+        return self.flush_now()
+        
+    def flush_now(self) -> bool:
+        """Write pending configuration changes to disk immediately
+        
+        If the write fails, every team changed since the last write is restored
+        from its snapshot, so all mutations sharing the write fail together.
+        """
+        if not self._dirty_teams:
+            return True
+        dirty_teams, self._dirty_teams = self._dirty_teams, set()
+        snapshots, self._team_snapshots = self._team_snapshots, {}
+        try:
+            if self._save_team_config_partial(dirty_teams):
+                return True
+        except Exception as e:
+            # Serialization errors happen before _write_config_file's own handling
+            logger.error(f"Failed to serialize team config: {e}")
+            
+        teams_config = self.config.setdefault("teams", {})
+        for team_name, team_config in snapshots.items():
+            if team_config is _NO_TEAM:
+                teams_config.pop(team_name, None)
+            else:
+                teams_config[team_name] = team_config
+        # A failed pass may have cached fragments of the rolled-back team configs
+        for team_name in dirty_teams | snapshots.keys():
+            self._config_fragments.pop(("teams", team_name), None)
+        return False
+            
+    def _get_chatbot_client(self):
         """Get a client connection to the chatbot server"""
         server_params = StdioServerParameters(
             command="python",
@@ -80,6 +329,74 @@ class TeamServer:
         )
         return stdio_client(server_params)
         
+    async def _chatbot_session_runner(self, ready: asyncio.Future, closed: asyncio.Event):
+        """Own the chatbot server connection until closed or the server exits
+        
+        The transport and session context managers hold anyio task groups, so
+        they are entered and exited from this one dedicated task.
+        """
+        exited = asyncio.Event()
+        try:
+            async with self._get_chatbot_client() as (read, write):
+                # Relay the server's output so its end (the server exiting) is noticed
+                relay_send, relay_read = anyio.create_memory_object_stream(_RELAY_BUFFER_SIZE)
+                
+                async def relay():
+                    async with relay_send:
+                        async for message in read:
+                            await relay_send.send(message)
+                    exited.set()
+                    
+                async with anyio.create_task_group() as tg:
+                    tg.start_soon(relay)
+                    async with ClientSession(relay_read, write) as session:
+                        await session.initialize()
+                        self._chatbot_session = session
+                        if not ready.done():  # The waiting caller may have been cancelled
+                            ready.set_result(session)
+                        
+                        closed_wait = asyncio.ensure_future(closed.wait())
+                        exited_wait = asyncio.ensure_future(exited.wait())
+                        try:
+                            await asyncio.wait({closed_wait, exited_wait}, return_when=asyncio.FIRST_COMPLETED)
+                        finally:
+                            closed_wait.cancel()
+                            exited_wait.cancel()
+                        if exited.is_set() and not closed.is_set():
+                            logger.warning("Chatbot server exited; reconnecting on next request")
+                    tg.cancel_scope.cancel()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"Chatbot server session ended: {e}")
+        finally:
+            self._chatbot_session = None
+            # Cancelled or ended before initializing: don't leave _chatbot waiting
+            if not ready.done():
+                ready.set_exception(ConnectionError("Chatbot server session ended before it was ready"))
+            
+    async def _chatbot(self) -> ClientSession:
+        """Return the shared chatbot server session, connecting lazily"""
+        async with self._chatbot_session_lock:
+            session = self._chatbot_session
+            if session is None or self._chatbot_task is None or self._chatbot_task.done():
+                self._chatbot_closed = asyncio.Event()
+                ready = asyncio.get_running_loop().create_future()
+                self._chatbot_task = asyncio.create_task(
+                    self._chatbot_session_runner(ready, self._chatbot_closed)
+                )
+                # The runner may already have reset _chatbot_session if the server exited
+                session = await ready
+            return session
+            
+    async def aclose(self):
+        """Close the shared chatbot server session"""
+        if self._chatbot_task is not None and not self._chatbot_task.done():
+            self._chatbot_closed.set()
+            await self._chatbot_task
+        self._chatbot_task = None
+        
     def _setup_tools(self):
         """Register MCP tools"""
         
@@ -291,77 +608,48 @@ class TeamServer:
                 )
             ]
             
+        # Argument model and handler per tool, validated once per call
+        self._tool_handlers = {
+            "list_teams": (ListTeamsArgs, lambda args: self._list_teams(args.include_inactive)),
+            "start_team": (StartTeamArgs, lambda args: self._start_team(args.team_name, args.mode)),
+            "stop_team": (StopTeamArgs, lambda args: self._stop_team(args.team_name, args.force)),
+            "restart_team": (TeamNameArgs, lambda args: self._restart_team(args.team_name)),
+            "get_team_status": (TeamNameArgs, lambda args: self._get_team_status(args.team_name)),
+            "add_team_member": (AddTeamMemberArgs, lambda args: self._add_team_member(
+                args.team_name, args.agent_name
+            )),
+            "remove_team_member": (RemoveTeamMemberArgs, lambda args: self._remove_team_member(
+                args.team_name, args.agent_name, args.stop_agent
+            )),
+            "create_team": (CreateTeamArgs, lambda args: self._create_team(
+                args.team_name,
+                args.display_name,
+                args.description,
+                args.agents,
+                args.coordination_mode,
+                args.auto_deploy
+            )),
+            "delete_team": (DeleteTeamArgs, lambda args: self._delete_team(args.team_name, args.force)),
+            "get_team_logs": (GetTeamLogsArgs, lambda args: self._get_team_logs(
+                args.team_name, args.lines, args.merge
+            ))
+        }
+        
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]):
-            if name == "list_teams":
-                result = await self._list_teams(arguments.get("include_inactive", True))
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-                
-            elif name == "start_team":
-                result = await self._start_team(
-                    arguments["team_name"],
-                    arguments.get("mode", "parallel")
-                )
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-                
-            elif name == "stop_team":
-                result = await self._stop_team(
-                    arguments["team_name"],
-                    arguments.get("force", False)
-                )
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-                
-            elif name == "restart_team":
-                result = await self._restart_team(arguments["team_name"])
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-                
-            elif name == "get_team_status":
-                result = await self._get_team_status(arguments["team_name"])
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-                
-            elif name == "add_team_member":
-                result = await self._add_team_member(
-                    arguments["team_name"],
-                    arguments["agent_name"]
-                )
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-                
-            elif name == "remove_team_member":
-                result = await self._remove_team_member(
-                    arguments["team_name"],
-                    arguments["agent_name"],
-                    arguments.get("stop_agent", False)
-                )
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-                
-            elif name == "create_team":
-                result = await self._create_team(
-                    arguments["team_name"],
-                    arguments["display_name"],
-                    arguments.get("description", ""),
-                    arguments["agents"],
-                    arguments.get("coordination_mode", "parallel"),
-                    arguments.get("auto_deploy", False)
-                )
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-                
-            elif name == "delete_team":
-                result = await self._delete_team(
-                    arguments["team_name"],
-                    arguments.get("force", False)
-                )
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            handler_entry = self._tool_handlers.get(name)
+            if handler_entry is None:
+                return [TextContent(type="text", text=f"Unknown tool: {name}")]
                 
-            elif name == "get_team_logs":
-                result = await self._get_team_logs(
-                    arguments["team_name"],
-                    arguments.get("lines", 20),
-                    arguments.get("merge", False)
-                )
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            arg_model, handler = handler_entry
+            try:
+                args = arg_model.model_validate(arguments or {})
+            except ValidationError as e:
+                result = {"success": False, "error": f"Invalid arguments for {name}: {e}"}
+                return [TextContent(type="text", text=_dump_result(result))]
                 
-            else:
-                return [TextContent(type="text", text=f"Unknown tool: {name}")]
+            result = await handler(args)
+            return [TextContent(type="text", text=_dump_result(result))]
                 
     async def _list_teams(self, include_inactive: bool) -> Dict[str, Any]:
         """List all teams with member status"""
@@ -372,14 +660,12 @@ class TeamServer:
             # Get agent status from chatbot server  
             agent_statuses = {}
             try:
-                async with self._get_chatbot_client() as (read, write):
-                    async with ClientSession(read, write) as session:
-                        await session.initialize()
-                        
-                        # Get all agent statuses
-                        agents_result = await session.call_tool("list_chatbots", {"include_stopped": True})
-                        agents_data = json.loads(agents_result.content[0].text)
-                        agent_statuses = {a["name"]: a for a in agents_data.get("chatbots", [])}
+                session = await self._chatbot()
+                
+                # Get all agent statuses
+                agents_result = await session.call_tool("list_chatbots", {"include_stopped": True})
+                agents_data = json.loads(agents_result.content[0].text)
+                agent_statuses = {a["name"]: a for a in agents_data.get("chatbots", [])}
             except Exception as e:
                 logger.warning(f"Could not connect to chatbot server: {e}")
                 # Use default status for all agents
@@ -389,23 +675,16 @@ class TeamServer:
             # Build team information
             for team_name, team_config in teams_config.items():
                 team_agents = team_config.get("agents", [])
-                running_count = 0
-                member_details = []
+                member_details = [
+                    TeamMember.from_status(agent_name, agent_statuses.get(agent_name, _UNKNOWN_STATUS))
+                    for agent_name in team_agents
+                ]
+                running_count = sum(1 for m in member_details if m.status == "running")
                 
-                for agent_name in team_agents:
-                    agent_info = agent_statuses.get(agent_name, {"status": "unknown"})
-                    if agent_info["status"] == "running":
-                        running_count += 1
-                        
-                    member_details.append({
-                        "name": agent_name,
-                        "status": agent_info["status"],
-                        "pid": agent_info.get("pid"),
-                        "memory_mb": agent_info.get("memory_mb"),
-                        "uptime": agent_info.get("uptime")
-                    })
+                if not (include_inactive or running_count):
+                    continue
                     
-                team_info = {
+                teams_list.append({
                     "name": team_name,
                     "display_name": team_config.get("name", team_name),
                     "description": team_config.get("description", ""),
@@ -414,10 +693,7 @@ class TeamServer:
                     "coordination_mode": team_config.get("coordination_mode", "parallel"),
                     "auto_deploy": team_config.get("auto_deploy", False),
                     "members": member_details
-                }
-                
-                if include_inactive or running_count > 0:
-                    teams_list.append(team_info)
+                })
                     
             return {
                 "success": True,
@@ -450,46 +726,44 @@ class TeamServer:
                 }
                 
             results = []
-            async with self._get_chatbot_client() as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
+            session = await self._chatbot()
+            
+            if mode == "sequential":
+                # Start agents one by one
+                for agent_name in team_agents:
+                    result = await session.call_tool("launch_chatbot", {
+                        "agent_name": agent_name,
+                        "background": True
+                    })
+                    agent_result = json.loads(result.content[0].text)
+                    results.append({
+                        "agent": agent_name,
+                        "success": agent_result["success"],
+                        "message": agent_result.get("message", agent_result.get("error"))
+                    })
                     
-                    if mode == "sequential":
-                        # Start agents one by one
-                        for agent_name in team_agents:
-                            result = await session.call_tool("launch_chatbot", {
-                                "agent_name": agent_name,
-                                "background": True
-                            })
-                            agent_result = json.loads(result.content[0].text)
-                            results.append({
-                                "agent": agent_name,
-                                "success": agent_result["success"],
-                                "message": agent_result.get("message", agent_result.get("error"))
-                            })
-                            
-                            # Wait between sequential starts
-                            if agent_result["success"]:
-                                await asyncio.sleep(2)
-                    else:
-                        # Start all agents in parallel
-                        tasks = []
-                        for agent_name in team_agents:
-                            task = session.call_tool("launch_chatbot", {
-                                "agent_name": agent_name,
-                                "background": True
-                            })
-                            tasks.append((agent_name, task))
-                            
-                        # Wait for all to complete
-                        for agent_name, task in tasks:
-                            result = await task
-                            agent_result = json.loads(result.content[0].text)
-                            results.append({
-                                "agent": agent_name,
-                                "success": agent_result["success"],
-                                "message": agent_result.get("message", agent_result.get("error"))
-                            })
+                    # Wait between sequential starts
+                    if agent_result["success"]:
+                        await asyncio.sleep(2)
+            else:
+                # Start all agents in parallel
+                tasks = []
+                for agent_name in team_agents:
+                    task = session.call_tool("launch_chatbot", {
+                        "agent_name": agent_name,
+                        "background": True
+                    })
+                    tasks.append((agent_name, task))
+                    
+                # Wait for all to complete
+                for agent_name, task in tasks:
+                    result = await task
+                    agent_result = json.loads(result.content[0].text)
+                    results.append({
+                        "agent": agent_name,
+                        "success": agent_result["success"],
+                        "message": agent_result.get("message", agent_result.get("error"))
+                    })
                             
             successful = sum(1 for r in results if r["success"])
             return {
@@ -527,28 +801,26 @@ class TeamServer:
                 }
                 
             results = []
-            async with self._get_chatbot_client() as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    
-                    # Stop all agents in parallel
-                    tasks = []
-                    for agent_name in team_agents:
-                        task = session.call_tool("stop_chatbot", {
-                            "agent_name": agent_name,
-                            "force": force
-                        })
-                        tasks.append((agent_name, task))
-                        
-                    # Wait for all to complete
-                    for agent_name, task in tasks:
-                        result = await task
-                        agent_result = json.loads(result.content[0].text)
-                        results.append({
-                            "agent": agent_name,
-                            "success": agent_result["success"],
-                            "message": agent_result.get("message", agent_result.get("error"))
-                        })
+            session = await self._chatbot()
+            
+            # Stop all agents in parallel
+            tasks = []
+            for agent_name in team_agents:
+                task = session.call_tool("stop_chatbot", {
+                    "agent_name": agent_name,
+                    "force": force
+                })
+                tasks.append((agent_name, task))
+                
+            # Wait for all to complete
+            for agent_name, task in tasks:
+                result = await task
+                agent_result = json.loads(result.content[0].text)
+                results.append({
+                    "agent": agent_name,
+                    "success": agent_result["success"],
+                    "message": agent_result.get("message", agent_result.get("error"))
+                })
                         
             successful = sum(1 for r in results if r["success"])
             return {
@@ -615,42 +887,43 @@ class TeamServer:
             total_memory = 0
             running_count = 0
             
-            async with self._get_chatbot_client() as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
+            session = await self._chatbot()
+            
+            for agent_name in team_agents:
+                result = await session.call_tool("get_chatbot_status", {
+                    "agent_name": agent_name
+                })
+                agent_result = json.loads(result.content[0].text)
+                
+                if agent_result["success"]:
+                    status = agent_result["status"]
+                    config = agent_result["config"]
+                    agent_status = status.get("status", "unknown")
                     
-                    for agent_name in team_agents:
-                        result = await session.call_tool("get_chatbot_status", {
-                            "agent_name": agent_name
-                        })
-                        agent_result = json.loads(result.content[0].text)
-                        
-                        if agent_result["success"]:
-                            status = agent_result["status"]
-                            config = agent_result["config"]
-                            
-                            member_info = {
-                                "name": agent_name,
-                                "display_name": config.get("name", agent_name),
-                                "status": status.get("status", "unknown"),
-                                "llm_type": config.get("llm_type", "unknown"),
-                                "pid": status.get("pid"),
-                                "uptime": status.get("uptime"),
-                                "memory_mb": status.get("memory_mb", 0),
-                                "cpu_percent": status.get("cpu_percent", 0)
-                            }
-                            
-                            if status.get("status") == "running":
-                                running_count += 1
-                                total_memory += status.get("memory_mb", 0)
-                        else:
-                            member_info = {
-                                "name": agent_name,
-                                "status": "error",
-                                "error": agent_result.get("error")
-                            }
-                            
-                        member_statuses.append(member_info)
+                    member_info = TeamMemberStatus(
+                        name=agent_name,
+                        display_name=config.get("name", agent_name),
+                        status=agent_status,
+                        llm_type=config.get("llm_type", "unknown"),
+                        pid=status.get("pid"),
+                        uptime=status.get("uptime"),
+                        memory_mb=status.get("memory_mb", 0),
+                        cpu_percent=status.get("cpu_percent", 0)
+                    )
+                    
+                    if agent_status == "running":
+                        running_count += 1
+                        total_memory += status.get("memory_mb", 0)
+                else:
+                    member_info = TeamMemberStatus(
+                        name=agent_name,
+                        display_name=agent_name,
+                        status="error",
+                        llm_type="unknown",
+                        error=agent_result.get("error")
+                    )
+                    
+                member_statuses.append(member_info)
                         
             # Calculate team health
             health_percentage = (running_count / len(team_agents) * 100) if team_agents else 0
@@ -693,7 +966,7 @@ class TeamServer:
                     "error": f"Unknown agent: {agent_name}. Available: {available_agents}"
                 }
                 
-            team_agents = teams_config[team_name].get("agents", [])
+            team_agents = teams_config[team_name].setdefault("agents", [])
             
             if agent_name in team_agents:
                 return {
@@ -702,17 +975,17 @@ class TeamServer:
                 }
                 
             # Add agent to team
-            updated_config = self.config.copy()
-            updated_config["teams"][team_name]["agents"].append(agent_name)
+            self._snapshot_team(team_name)
+            team_agents.append(agent_name)
             
-            # Save configuration
-            if self._save_team_config(updated_config):
+            # Save configuration; a failed write rolls back every change it covered
+            if await self._persist(team_name):
                 return {
                     "success": True,
                     "message": f"Added agent {agent_name} to team {team_name}",
                     "team_name": team_name,
                     "agent_name": agent_name,
-                    "new_member_count": len(updated_config["teams"][team_name]["agents"])
+                    "new_member_count": len(team_agents)
                 }
             else:
                 return {
@@ -747,27 +1020,25 @@ class TeamServer:
             # Stop agent if requested
             stop_result = None
             if stop_agent:
-                async with self._get_chatbot_client() as (read, write):
-                    async with ClientSession(read, write) as session:
-                        await session.initialize()
-                        result = await session.call_tool("stop_chatbot", {
-                            "agent_name": agent_name,
-                            "force": False
-                        })
-                        stop_result = json.loads(result.content[0].text)
+                session = await self._chatbot()
+                result = await session.call_tool("stop_chatbot", {
+                    "agent_name": agent_name,
+                    "force": False
+                })
+                stop_result = json.loads(result.content[0].text)
                         
             # Remove agent from team
-            updated_config = self.config.copy()
-            updated_config["teams"][team_name]["agents"].remove(agent_name)
+            self._snapshot_team(team_name)
+            team_agents.remove(agent_name)
             
-            # Save configuration
-            if self._save_team_config(updated_config):
+            # Save configuration; a failed write rolls back every change it covered
+            if await self._persist(team_name):
                 return {
                     "success": True,
                     "message": f"Removed agent {agent_name} from team {team_name}",
                     "team_name": team_name,
                     "agent_name": agent_name,
-                    "new_member_count": len(updated_config["teams"][team_name]["agents"]),
+                    "new_member_count": len(team_agents),
                     "stop_result": stop_result
                 }
             else:
@@ -794,7 +1065,7 @@ class TeamServer:
                 }
                 
             # Validate all agents exist
-            invalid_agents = [a for a in agents if a not in agents_config]
+            invalid_agents = sorted(set(agents) - agents_config.keys())
             if invalid_agents:
                 available_agents = list(agents_config.keys())
                 return {
@@ -814,11 +1085,12 @@ class TeamServer:
             }
             
             # Add team to configuration
-            updated_config = self.config.copy()
-            updated_config["teams"][team_name] = team_config
+            self._snapshot_team(team_name)
+            teams_config = self.config.setdefault("teams", teams_config)
+            teams_config[team_name] = team_config
             
-            # Save configuration
-            if self._save_team_config(updated_config):
+            # Save configuration; a failed write rolls back every change it covered
+            if await self._persist(team_name):
                 return {
                     "success": True,
                     "message": f"Created team {team_name} with {len(agents)} members",
@@ -864,11 +1136,11 @@ class TeamServer:
                 stop_result = await self._stop_team(team_name, force=True)
                 
             # Remove team from configuration
-            updated_config = self.config.copy()
-            del updated_config["teams"][team_name]
+            self._snapshot_team(team_name)
+            del teams_config[team_name]
             
-            # Save configuration
-            if self._save_team_config(updated_config):
+            # Save configuration; a failed write rolls back every change it covered
+            if await self._persist(team_name):
                 return {
                     "success": True,
                     "message": f"Deleted team {team_name}",
@@ -905,37 +1177,66 @@ class TeamServer:
                     "error": f"Team {team_name} has no members"
                 }
                 
-            # Get logs from all team members
-            member_logs = []
+            # Tail log files directly when they exist locally
+            log_files = {agent_name: chatbot_log_file(agent_name) for agent_name in team_agents}
+            local_agents = [agent_name for agent_name in team_agents if log_files[agent_name].is_file()]
+            tails = await asyncio.gather(*[
+                asyncio.to_thread(_tail_file, log_files[agent_name], lines)
+                for agent_name in local_agents
+            ], return_exceptions=True)
             
-            async with self._get_chatbot_client() as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    
-                    for agent_name in team_agents:
-                        result = await session.call_tool("get_chatbot_logs", {
-                            "agent_name": agent_name,
-                            "lines": lines
-                        })
-                        log_result = json.loads(result.content[0].text)
+            log_results = {}
+            for agent_name, tail in zip(local_agents, tails):
+                if isinstance(tail, Exception):
+                    continue
+                log_results[agent_name] = {
+                    "success": True,
+                    "logs": "".join(tail),
+                    "log_file": str(log_files[agent_name]),
+                    "lines_returned": len(tail)
+                }
+                
+            # Fall back to the chatbot server for any logs not read locally
+            remote_agents = [agent_name for agent_name in team_agents if agent_name not in log_results]
+            if remote_agents:
+                session = await self._chatbot()
+                
+                # Fetch remaining members' logs concurrently over the one session
+                results = await asyncio.gather(*[
+                    session.call_tool("get_chatbot_logs", {
+                        "agent_name": agent_name,
+                        "lines": lines
+                    })
+                    for agent_name in remote_agents
+                ], return_exceptions=True)
                         
-                        member_logs.append({
-                            "agent": agent_name,
-                            "success": log_result["success"],
-                            "logs": log_result.get("logs", ""),
-                            "log_file": log_result.get("log_file", ""),
-                            "lines_returned": log_result.get("lines_returned", 0),
-                            "error": log_result.get("error")
-                        })
+                for agent_name, result in zip(remote_agents, results):
+                    if isinstance(result, Exception):
+                        log_results[agent_name] = {"success": False, "error": str(result)}
+                    else:
+                        log_results[agent_name] = json.loads(result.content[0].text)
+                        
+            member_logs = []
+            for agent_name in team_agents:
+                log_result = log_results[agent_name]
+                member_logs.append({
+                    "agent": agent_name,
+                    "success": log_result["success"],
+                    "logs": log_result.get("logs", ""),
+                    "log_file": log_result.get("log_file", ""),
+                    "lines_returned": log_result.get("lines_returned", 0),
+                    "error": log_result.get("error")
+                })
                         
             if merge:
                 # TODO: Implement timestamp-based log merging
                 # For now, just concatenate logs
-                merged_logs = ""
+                parts = []
                 for member in member_logs:
                     if member["success"] and member["logs"]:
-                        merged_logs += f"\n=== {member['agent']} ===\n"
-                        merged_logs += member["logs"]
+                        parts.append(f"\n=== {member['agent']} ===\n")
+                        parts.append(member["logs"])
+                merged_logs = "".join(parts)
                         
                 return {
                     "success": True,
@@ -959,14 +1260,26 @@ class TeamServer:
             
     async def run(self):
         """Run the MCP server"""
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options()
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options()
+                )
+        finally:
+            await self.aclose()
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+            self.flush_now()
 
 
-if __name__ == "__main__":
+def _main():
+    """Configure logging and run the team server over stdio"""
+    logging.basicConfig(level=logging.INFO)
     server = TeamServer()
-    asyncio.run(server.run())
\ No newline at end of file
+    asyncio.run(server.run())
+
+
+if __name__ == "__main__":
+    _main()
\ No newline at end of file
@@ -6,19 +6,111 @@ Provides basic storage and retrieval of memories with vector similarity search
 
 import os
 import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 import json
 
 import asyncpg
 import numpy as np
-from openai import OpenAI
+from openai import AsyncOpenAI
+from pgvector.asyncpg import register_vector
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("memory-client")
 
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Maximum number of embeddings kept in the per-client LRU cache
+EMBEDDING_CACHE_SIZE = 4096
+
+# OpenAI per-request embedding caps; UTF-8 bytes bound the token count from above
+EMBEDDING_MAX_INPUTS = 2048
+EMBEDDING_MAX_TOKENS = 300_000
+
+# Connection pool sizing shared by every agent using this client
+POOL_MIN_SIZE = 2
+POOL_MAX_SIZE = 10
+POOL_MAX_QUERIES = 10000
+POOL_MAX_INACTIVE_LIFETIME = 300.0
+
+# Seconds to wait for a free pool connection before failing the call
+POOL_ACQUIRE_TIMEOUT = 5.0
+
+_SQL_STORE = """
+INSERT INTO memories (agent_id, content, embedding, metadata)
+VALUES ($1, $2, $3, $4)
+RETURNING id
+"""
+
+_SQL_STORE_BULK = """
+INSERT INTO memories (agent_id, content, embedding, metadata)
+VALUES ($1, $2, $3, $4)
+"""
+
+_SQL_SEARCH_ALL = """
+SELECT 
+    id, 
+    agent_id, 
+    content, 
+    metadata,
+    to_char(created_at, 'YYYY-MM-DD"T"HH24:MI:SS.US') as created_at,
+    1 - (embedding <=> $1::vector) as similarity
+FROM memories
+ORDER BY embedding <=> $1::vector
+LIMIT $2
+"""
+
+_SQL_SEARCH_AGENT = """
+SELECT 
+    id, 
+    agent_id, 
+    content, 
+    metadata,
+    to_char(created_at, 'YYYY-MM-DD"T"HH24:MI:SS.US') as created_at,
+    1 - (embedding <=> $1::vector) as similarity
+FROM memories
+WHERE agent_id = $2
+ORDER BY embedding <=> $1::vector
+LIMIT $3
+"""
+
+_SQL_RECENT_ALL = """
+SELECT
+    id,
+    agent_id,
+    content,
+    metadata,
+    to_char(created_at, 'YYYY-MM-DD"T"HH24:MI:SS.US') as created_at
+FROM memories
+ORDER BY memories.created_at DESC
+LIMIT $1
+"""
+
+_SQL_RECENT_AGENT = """
+SELECT
+    id,
+    agent_id,
+    content,
+    metadata,
+    to_char(created_at, 'YYYY-MM-DD"T"HH24:MI:SS.US') as created_at
+FROM memories
+WHERE agent_id = $1
+ORDER BY memories.created_at DESC
+LIMIT $2
+"""
+
+_SQL_DELETE = "DELETE FROM memories WHERE id = $1 RETURNING id"
+
+# Transaction-scoped HNSW candidate list size for the next search
+_SQL_SET_EF_SEARCH = "SELECT set_config('hnsw.ef_search', $1, true)"
+
+# Lower bound for hnsw.ef_search regardless of the requested limit
+MIN_EF_SEARCH = 40
+
 
 class MemoryClient:
     """Simple memory client for vector-based memory storage"""
@@ -27,18 +119,47 @@ class MemoryClient:
         self.db_url = db_url
         self.pool = None
         self.openai_client = None
+        self._rng = np.random.default_rng()
+        self._embedding_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
         
         # Initialize OpenAI if API key provided
         if openai_api_key or os.getenv("OPENAI_API_KEY"):
-            self.openai_client = OpenAI(api_key=openai_api_key or os.getenv("OPENAI_API_KEY"))
+            self.openai_client = AsyncOpenAI(api_key=openai_api_key or os.getenv("OPENAI_API_KEY"))
         else:
             logger.warning("No OpenAI API key provided - embeddings will be random")
     
     async def connect(self):
-        """Connect to the database"""
-        self.pool = await asyncpg.create_pool(self.db_url, min_size=1, max_size=10)
+        """Connect to the database
+        
+        Queries go through asyncpg's per-connection statement cache, so each
+        SQL string is prepared once per connection and re-prepared after
+        schema changes.
+        """
+        self.pool = await asyncpg.create_pool(
+            self.db_url,
+            min_size=POOL_MIN_SIZE,
+            max_size=POOL_MAX_SIZE,
+            max_queries=POOL_MAX_QUERIES,
+            max_inactive_connection_lifetime=POOL_MAX_INACTIVE_LIFETIME,
+            init=self._init_connection
+        )
         logger.info("Connected to PostgreSQL")
     
+    @staticmethod
+    async def _init_connection(conn: asyncpg.Connection):
+        """Register type codecs on each new pool connection"""
+        # Send embeddings in pgvector's binary format instead of text literals
+        await register_vector(conn)
+        
+        # Decode JSONB metadata to dicts in the driver rather than per row
+        await conn.set_type_codec(
+            'jsonb',
+            encoder=json.dumps,
+            decoder=json.loads,
+            schema='pg_catalog',
+            format='text'
+        )
+    
     async def close(self):
         """Close database connection"""
         if self.pool:
@@ -51,72 +172,134 @@ class MemoryClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
     
-    def _get_embedding(self, text: str) -> List[float]:
-        """Get embedding for text using OpenAI or fallback to random"""
-        if self.openai_client:
-            try:
-                response = self.openai_client.embeddings.create(
-                    model="text-embedding-3-small",
-                    input=text
-                )
-                return response.data[0].embedding
-            except Exception as e:
-                logger.error(f"OpenAI embedding failed: {e}")
-        
-        # Fallback to random embedding for testing
-        logger.debug("Using random embedding")
-        return np.random.rand(1536).tolist()
+    @staticmethod
+    def _embedding_cache_key(text: str) -> bytes:
+        """Cache key for a text embedded with EMBEDDING_MODEL"""
+        return hashlib.blake2b(f"{EMBEDDING_MODEL}\0{text}".encode(), digest_size=16).digest()
+    
+    @staticmethod
+    def _embedding_chunks(texts: List[str], indices: List[int]):
+        """Split text indices into requests within the input and token caps"""
+        chunk, tokens = [], 0
+        for i in indices:
+            size = len(texts[i].encode())
+            if chunk and (len(chunk) == EMBEDDING_MAX_INPUTS or tokens + size > EMBEDDING_MAX_TOKENS):
+                yield chunk
+                chunk, tokens = [], 0
+            chunk.append(i)
+            tokens += size
+        if chunk:
+            yield chunk
+    
+    async def _get_embeddings_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """Get embeddings for several texts, requesting only cache misses from OpenAI"""
+        cache = self._embedding_cache
+        keys = [self._embedding_cache_key(text) for text in texts]
+        embeddings = []
+        for key in keys:
+            embedding = cache.get(key)
+            if embedding is not None:
+                cache.move_to_end(key)
+            embeddings.append(embedding)
+        
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing and self.openai_client:
+            # Failures propagate: a partly random batch would be stored as if it were real
+            for chunk in self._embedding_chunks(texts, missing):
+                try:
+                    response = await self.openai_client.embeddings.create(
+                        model=EMBEDDING_MODEL,
+                        input=[texts[i] for i in chunk]
+                    )
+                except Exception as e:
+                    logger.error(f"OpenAI embedding failed for {len(chunk)} texts: {e}")
+                    raise
+                for i, data in zip(chunk, response.data):
+                    embedding = np.asarray(data.embedding, dtype=np.float32)
+                    embeddings[i] = embedding
+                    cache[keys[i]] = embedding
+                while len(cache) > EMBEDDING_CACHE_SIZE:
+                    cache.popitem(last=False)
+            missing = []
+        
+        # Without an OpenAI key, fall back to random embeddings for testing (never cached)
+        if missing:
+            logger.debug("Using random embeddings")
+            for i in missing:
+                embeddings[i] = self._rng.standard_normal(1536, dtype=np.float32)
+        
+        return embeddings
+    
+    async def _get_embedding(self, text: str) -> np.ndarray:
+        """Get embedding for text using OpenAI, or a random one without an API key"""
+        return (await self._get_embeddings_batch([text]))[0]
     
     async def store_memory(self, agent_id: str, content: str, 
                           metadata: Optional[Dict[str, Any]] = None) -> int:
         """Store a memory with its embedding"""
-        embedding = self._get_embedding(content)
-        
-        # Convert embedding list to PostgreSQL vector format
-        embedding_str = '[' + ','.join(map(str, embedding)) + ']'
+        embedding = await self._get_embedding(content)
         
-        query = """
-        INSERT INTO memories (agent_id, content, embedding, metadata)
-        VALUES ($1, $2, $3::vector, $4)
-        RETURNING id
-        """
-        
-        async with self.pool.acquire() as conn:
+        async with self.pool.acquire(timeout=POOL_ACQUIRE_TIMEOUT) as conn:
             memory_id = await conn.fetchval(
-                query, 
+                _SQL_STORE,
                 agent_id, 
                 content, 
-                embedding_str, 
-                json.dumps(metadata or {})
+                embedding, 
+                metadata or {}
             )
         
         logger.info(f"Stored memory {memory_id} for agent {agent_id}")
         return memory_id
     
+    async def store_memories_bulk(self, agent_id: str, contents: List[str],
+                                  metadatas: Optional[List[Dict[str, Any]]] = None) -> int:
+        """Store several memories with one embedding request and one insert batch
+        
+        asyncpg pipelines executemany over one prepared statement, so the
+        whole batch costs a single round-trip.
+        """
+        if not contents:
+            return 0
+        if metadatas is not None and len(metadatas) != len(contents):
+            raise ValueError(f"Got {len(metadatas)} metadatas for {len(contents)} contents")
+        
+        embeddings = await self._get_embeddings_batch(contents)
+        metadatas = metadatas or [{}] * len(contents)
+        
+        records = [
+            (agent_id, content, embedding, metadata or {})
+            for content, embedding, metadata in zip(contents, embeddings, metadatas)
+        ]
+        
+        async with self.pool.acquire(timeout=POOL_ACQUIRE_TIMEOUT) as conn:
+            await conn.executemany(_SQL_STORE_BULK, records)
+        
+        logger.info(f"Stored {len(records)} memories for agent {agent_id}")
+        return len(records)
+    
+    @staticmethod
+    async def _search_rows(conn: asyncpg.Connection, query_embedding: np.ndarray,
+                           agent_id: Optional[str], limit: int) -> List[asyncpg.Record]:
+        """Run the similarity search with a transaction-scoped ef_search"""
+        async with conn.transaction():
+            await conn.fetchval(_SQL_SET_EF_SEARCH, str(max(MIN_EF_SEARCH, limit * 4)))
+            if agent_id is None:
+                return await conn.fetch(_SQL_SEARCH_ALL, query_embedding, limit)
+            return await conn.fetch(_SQL_SEARCH_AGENT, query_embedding, agent_id, limit)
+    
     async def search_memories(self, query: str, agent_id: Optional[str] = None, 
                             limit: int = 5) -> List[Dict[str, Any]]:
         """Search for similar memories using vector similarity"""
-        query_embedding = self._get_embedding(query)
-        
-        # Convert embedding list to PostgreSQL vector format
-        query_embedding_str = '[' + ','.join(map(str, query_embedding)) + ']'
-        
-        sql = """
-        SELECT 
-            id, 
-            agent_id, 
-            content, 
-            metadata,
-            created_at,
-            1 - (embedding <=> $1::vector) as similarity
-        FROM memories
-        WHERE ($2::text IS NULL OR agent_id = $2)
-        ORDER BY embedding <=> $1::vector
-        LIMIT $3
-        """
+        query_embedding = await self._get_embedding(query)
         
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch(sql, query_embedding_str, agent_id, limit)
+        async with self.pool.acquire(timeout=POOL_ACQUIRE_TIMEOUT) as conn:
+            try:
+                rows = await self._search_rows(conn, query_embedding, agent_id, limit)
+            except asyncpg.exceptions.InvalidCachedStatementError:
+                # asyncpg re-prepares stale cached statements (e.g. after a schema
+                # change) itself, except inside a transaction; it has dropped the
+                # stale entry by now, so one retry prepares afresh
+                rows = await self._search_rows(conn, query_embedding, agent_id, limit)
         
         results = []
         for row in rows:
@@ -124,8 +307,8 @@ class MemoryClient:
                 "id": row["id"],
                 "agent_id": row["agent_id"],
                 "content": row["content"],
-                "metadata": json.loads(row["metadata"]) if row["metadata"] else {},
-                "created_at": row["created_at"].isoformat() if row["created_at"] else None,
+                "metadata": row["metadata"] or {},
+                "created_at": row["created_at"],
                 "similarity": float(row["similarity"])
             })
         
@@ -134,16 +317,11 @@ class MemoryClient:
     async def get_recent_memories(self, agent_id: Optional[str] = None, 
                                  limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent memories chronologically"""
-        sql = """
-        SELECT id, agent_id, content, metadata, created_at
-        FROM memories
-        WHERE ($1::text IS NULL OR agent_id = $1)
-        ORDER BY created_at DESC
-        LIMIT $2
-        """
-        
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch(sql, agent_id, limit)
+        async with self.pool.acquire(timeout=POOL_ACQUIRE_TIMEOUT) as conn:
+            if agent_id is None:
+                rows = await conn.fetch(_SQL_RECENT_ALL, limit)
+            else:
+                rows = await conn.fetch(_SQL_RECENT_AGENT, agent_id, limit)
         
         results = []
         for row in rows:
@@ -151,26 +329,24 @@ class MemoryClient:
                 "id": row["id"],
                 "agent_id": row["agent_id"],
                 "content": row["content"],
-                "metadata": json.loads(row["metadata"]) if row["metadata"] else {},
-                "created_at": row["created_at"].isoformat() if row["created_at"] else None
+                "metadata": row["metadata"] or {},
+                "created_at": row["created_at"]
             })
         
         return results
     
     async def delete_memory(self, memory_id: int) -> bool:
         """Delete a specific memory"""
-        sql = "DELETE FROM memories WHERE id = $1"
+        async with self.pool.acquire(timeout=POOL_ACQUIRE_TIMEOUT) as conn:
+            deleted_id = await conn.fetchval(_SQL_DELETE, memory_id)
         
-        async with self.pool.acquire() as conn:
-            result = await conn.execute(sql, memory_id)
-        
-        return result == "DELETE 1"
+        return deleted_id is not None
     
     async def clear_agent_memories(self, agent_id: str) -> int:
         """Clear all memories for a specific agent"""
         sql = "DELETE FROM memories WHERE agent_id = $1"
         
-        async with self.pool.acquire() as conn:
+        async with self.pool.acquire(timeout=POOL_ACQUIRE_TIMEOUT) as conn:
             result = await conn.execute(sql, agent_id)
         
         # Extract count from result
@@ -199,13 +375,15 @@ async def test_memory_client():
         ]
         
         print("📝 Storing memories...")
+        timestamp = datetime.utcnow().isoformat()
+        stored = await client.store_memories_bulk(
+            agent_id,
+            memories,
+            metadatas=[{"source": "test", "timestamp": timestamp}] * len(memories)
+        )
         for memory in memories:
-            memory_id = await client.store_memory(
-                agent_id, 
-                memory,
-                metadata={"source": "test", "timestamp": datetime.utcnow().isoformat()}
-            )
-            print(f"  Stored: {memory[:50]}... (ID: {memory_id})")
+            print(f"  Stored: {memory[:50]}...")
+        print(f"  Total stored: {stored}")
         
         # Search memories
         print("\n🔍 Searching memories...")
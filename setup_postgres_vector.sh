@@ -44,10 +44,12 @@ CREATE TABLE IF NOT EXISTS memories (
     created_at TIMESTAMP DEFAULT NOW()
 );
 
--- Create index for vector similarity search
-CREATE INDEX IF NOT EXISTS memories_embedding_idx ON memories 
-USING ivfflat (embedding vector_cosine_ops)
-WITH (lists = 100);
+-- Create HNSW index for vector similarity search
+-- (re-running this script migrates older databases off the ivfflat index)
+DROP INDEX IF EXISTS memories_embedding_idx;
+CREATE INDEX IF NOT EXISTS memories_embedding_hnsw ON memories
+USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64);
 
 -- Create simple info table to verify connection
 CREATE TABLE IF NOT EXISTS info (
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for MVPOrchestrator's image ref and timestamp helpers
+"""
+
+import pytest
+
+from orchestrator_mvp import MVPOrchestrator
+
+MIRROR = "localhost:5000"
+
+
+def make_orchestrator(registry_mirror=MIRROR):
+    """Orchestrator with only the mirror configured; skips connecting to Docker"""
+    orchestrator = MVPOrchestrator.__new__(MVPOrchestrator)
+    orchestrator.registry_mirror = registry_mirror
+    return orchestrator
+
+
+@pytest.mark.parametrize("ref, expected", [
+    ("ubuntu", f"{MIRROR}/library/ubuntu"),
+    ("ubuntu:22.04", f"{MIRROR}/library/ubuntu:22.04"),
+    ("deepworks/claude-code:latest", f"{MIRROR}/deepworks/claude-code:latest"),
+    ("org/img", f"{MIRROR}/org/img"),
+])
+def test_mirrored_routes_docker_hub_refs(ref, expected):
+    """Docker Hub refs go through the mirror, official images under library/"""
+    assert make_orchestrator()._mirrored(ref) == expected
+
+
+@pytest.mark.parametrize("ref", [
+    "ghcr.io/org/img:tag",
+    "registry.example.com/img",
+    "localhost/img:dev",
+    "localhost:5000/org/img:tag",
+    "myregistry:8443/img",
+])
+def test_mirrored_leaves_registry_refs_alone(ref):
+    """A ref that already names a registry host is not mirrored"""
+    assert make_orchestrator()._mirrored(ref) == ref
+
+
+def test_mirrored_without_mirror_and_trailing_slash():
+    assert make_orchestrator(None)._mirrored("ubuntu") == "ubuntu"
+    assert make_orchestrator(f"{MIRROR}/")._mirrored("org/img") == f"{MIRROR}/org/img"
+
+
+@pytest.mark.parametrize("ref, expected", [
+    ("deepworks/claude-code:latest", ("deepworks/claude-code", "latest")),
+    ("ubuntu:22.04", ("ubuntu", "22.04")),
+    ("ubuntu", ("ubuntu", "latest")),
+    ("localhost:5000/img", ("localhost:5000/img", "latest")),
+    ("localhost:5000/org/img:v1", ("localhost:5000/org/img", "v1")),
+])
+def test_repository_tag_split(ref, expected):
+    """The tag is only taken from the last path component, never a registry port"""
+    assert MVPOrchestrator._repository_tag(ref) == expected
+
+
+@pytest.mark.parametrize("created, expected", [
+    (0, "1970-01-01T00:00:00+00:00"),
+    (1700000000, "2023-11-14T22:13:20+00:00"),
+    (1700000000.5, "2023-11-14T22:13:20.500000+00:00"),
+    ("2024-05-06T07:08:09.123456789Z", "2024-05-06T07:08:09.123456+00:00"),
+    ("2024-05-06T07:08:09.5Z", "2024-05-06T07:08:09.500000+00:00"),
+    ("2024-05-06T07:08:09Z", "2024-05-06T07:08:09+00:00"),
+])
+def test_created_iso(created, expected):
+    """Epoch seconds and RFC 3339 with nanoseconds both become UTC isoformat"""
+    assert MVPOrchestrator._created_iso(created) == expected
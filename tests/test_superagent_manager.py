@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for SuperAgentManager's agent process detection
+"""
+
+import subprocess
+
+import psutil
+import pytest
+
+from launchers import superagent_manager
+from launchers.superagent_manager import LAUNCHER_SCRIPT, SuperAgentManager
+
+KNOWN = frozenset({"grok4_agent", "claude_agent"})
+
+
+@pytest.mark.parametrize("cmdline, expected", [
+    (["python", LAUNCHER_SCRIPT, "grok4_agent"], "grok4_agent"),
+    (["python3", "-u", f"/opt/superagent/launchers/{LAUNCHER_SCRIPT}", "grok4_agent"], "grok4_agent"),
+    (["python3", "-X", "utf8", "-u", LAUNCHER_SCRIPT, "claude_agent"], "claude_agent"),
+    (["python", LAUNCHER_SCRIPT, "--verbose", "claude_agent"], "claude_agent"),
+    (["python", LAUNCHER_SCRIPT], None),
+    (["python", "other_script.py", "grok4_agent"], None),
+    ([], None),
+])
+def test_launched_agent_type_parses_argv(cmdline, expected):
+    """Interpreter flags before the script and options after it are skipped"""
+    assert SuperAgentManager._launched_agent_type(cmdline) == expected
+
+
+@pytest.mark.parametrize("cmdline", [
+    ["sh", "-c", f"python {LAUNCHER_SCRIPT} grok4_agent"],
+    ["bash", "-c", f"cd launchers && python ./{LAUNCHER_SCRIPT} grok4_agent"],
+    [LAUNCHER_SCRIPT, "grok4_agent"],
+])
+def test_launched_agent_type_ignores_shells_and_argv0(cmdline):
+    """A shell whose -c string mentions the launcher is not the agent itself"""
+    assert SuperAgentManager._launched_agent_type(cmdline) is None
+    assert SuperAgentManager._launched_agent_type(cmdline, KNOWN) is None
+
+
+def test_launched_agent_type_known_filter():
+    """With known agent types, arguments that are not agent types are skipped"""
+    cmdline = ["python", LAUNCHER_SCRIPT, "--config", "custom.json", "grok4_agent"]
+    assert SuperAgentManager._launched_agent_type(cmdline, KNOWN) == "grok4_agent"
+    assert SuperAgentManager._launched_agent_type(cmdline) == "custom.json"
+    assert SuperAgentManager._launched_agent_type(["python", LAUNCHER_SCRIPT, "gemini_agent"], KNOWN) is None
+
+
+def test_pgrep_argv_resolves_agent_types(monkeypatch):
+    """pgrep pids are resolved to their real argv before the agent type is read"""
+    argvs = {
+        101: ["python3", "-u", f"/srv/launchers/{LAUNCHER_SCRIPT}", "grok4_agent"],
+        102: ["sh", "-c", f"python {LAUNCHER_SCRIPT} claude_agent"],
+        104: ["python", f"/srv/my launchers/{LAUNCHER_SCRIPT}", "claude_agent"],
+    }
+
+    class FakeProcess:
+        def __init__(self, pid):
+            if pid not in argvs:
+                raise psutil.NoSuchProcess(pid)
+            self.pid = pid
+
+        def cmdline(self):
+            return argvs[self.pid]
+
+    def fake_run(args, **kwargs):
+        assert args == ["pgrep", "-f", LAUNCHER_SCRIPT]
+        return subprocess.CompletedProcess(args, 0, stdout="101\n102\n103\n104\n", stderr="")
+
+    monkeypatch.setattr(superagent_manager.subprocess, "run", fake_run)
+    monkeypatch.setattr(psutil, "Process", FakeProcess)
+
+    processes = SuperAgentManager._pgrep_agents()
+    assert [pid for pid, _ in processes] == [101, 102, 104]
+    assert {
+        pid: SuperAgentManager._launched_agent_type(argv, KNOWN) for pid, argv in processes
+    } == {101: "grok4_agent", 102: None, 104: "claude_agent"}
+
+
+def test_pgrep_unusable_returns_none(monkeypatch):
+    """A pgrep error (exit status above 1) falls back to other scanners"""
+    monkeypatch.setattr(
+        superagent_manager.subprocess, "run",
+        lambda args, **kwargs: subprocess.CompletedProcess(args, 2, stdout="", stderr="bad option")
+    )
+    assert SuperAgentManager._pgrep_agents() is None
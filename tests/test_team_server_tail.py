@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the team server's backwards log tail
+"""
+
+import pytest
+
+from mcp_servers import team_server
+from mcp_servers.team_server import _tail_file
+
+
+def expected_tail(text: str, lines: int):
+    return text.splitlines(keepends=True)[-lines:] if lines > 0 else []
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    """Shrink the block size so short files span several blocks"""
+    monkeypatch.setattr(team_server, "_TAIL_BLOCK_SIZE", 8)
+
+
+def write_log(tmp_path, text: str):
+    path = tmp_path / "agent.log"
+    path.write_bytes(text.encode())
+    return path
+
+
+@pytest.mark.parametrize("lines", [1, 2, 3, 5])
+def test_tail_across_block_boundaries(tmp_path, small_blocks, lines):
+    text = "".join(f"line {i:02d} of the log\n" for i in range(20))
+    assert _tail_file(write_log(tmp_path, text), lines) == expected_tail(text, lines)
+
+
+def test_tail_with_real_block_size(tmp_path):
+    """Lines straddling the default block edge come back whole"""
+    line = "x" * 1000 + "\n"
+    text = line * (2 * team_server._TAIL_BLOCK_SIZE // len(line) + 3)
+    tail = _tail_file(write_log(tmp_path, text), 100)
+    assert tail == expected_tail(text, 100)
+    assert len(tail) == 100
+
+
+def test_tail_without_trailing_newline(tmp_path, small_blocks):
+    text = "first line\nsecond line\nlast line, no newline"
+    assert _tail_file(write_log(tmp_path, text), 2) == ["second line\n", "last line, no newline"]
+
+
+def test_tail_more_lines_than_file(tmp_path, small_blocks):
+    text = "only\ntwo lines\n"
+    assert _tail_file(write_log(tmp_path, text), 50) == ["only\n", "two lines\n"]
+    assert _tail_file(write_log(tmp_path, ""), 5) == []
+
+
+def test_tail_zero_lines(tmp_path):
+    assert _tail_file(write_log(tmp_path, "some\nlines\n"), 0) == []
+
+
+@pytest.mark.parametrize("offset", range(8))
+def test_tail_multibyte_split_at_block_edge(tmp_path, small_blocks, offset):
+    """UTF-8 characters cut by a block edge are decoded intact"""
+    # Shifting the text by a byte at a time moves a block edge through every
+    # position of the 3- and 4-byte characters
+    text = "a" * offset + "\n" + "".join(f"€{i}🙂 café\n" for i in range(6))
+    lines = 4
+    tail = _tail_file(write_log(tmp_path, text), lines)
+    assert tail == expected_tail(text, lines)
+    assert "�" not in "".join(tail)